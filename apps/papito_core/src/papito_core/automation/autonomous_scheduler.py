@@ -466,7 +466,7 @@ class AutonomousScheduler:
         prompt = random.choice(self.ENGAGEMENT_PROMPTS)
         if self._post_memory:
             for _ in range(3):
-                if not self._post_memory.is_repeated(prompt) and not self._post_memory.is_too_similar(prompt):
+                if not self._post_memory.is_duplicate(prompt):
                     break
                 prompt = random.choice(self.ENGAGEMENT_PROMPTS)
         
@@ -554,9 +554,7 @@ class AutonomousScheduler:
                         platform="x",
                     )
                     candidate = (last_result or {}).get("text", "")
-                    if self._post_memory and (
-                        self._post_memory.is_repeated(candidate) or self._post_memory.is_too_similar(candidate)
-                    ):
+                    if self._post_memory and self._post_memory.is_duplicate(candidate):
                         continue
                     break
 
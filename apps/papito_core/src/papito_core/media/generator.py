@@ -8,12 +8,16 @@ Integrates with:
 
 from __future__ import annotations
 
+import asyncio
+import itertools
 import json
 import os
-import uuid
+import secrets
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
+from pathlib import Path
+from types import MappingProxyType
 from typing import Any, Dict, List, Optional
 import logging
 import random
@@ -23,6 +27,11 @@ try:
 except ImportError:
     httpx = None
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 try:
     from google import genai
     from google.genai import types
@@ -33,6 +42,25 @@ except ImportError:
 
 logger = logging.getLogger("papito.media")
 
+# (year, month, formatted) - the prompt period only changes monthly
+_PERIOD_CACHE: tuple = (0, 0, "")
+
+
+def _json_bytes(obj: Any) -> bytes:
+    """Serialize to compact JSON, byte-identical with or without orjson."""
+    if orjson:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def _current_period() -> str:
+    """Return the current month as "Month YYYY", formatting it once per month."""
+    global _PERIOD_CACHE
+    now = datetime.now()
+    if _PERIOD_CACHE[:2] != (now.year, now.month):
+        _PERIOD_CACHE = (now.year, now.month, now.strftime("%B %Y"))
+    return _PERIOD_CACHE[2]
+
 
 class MediaType(str, Enum):
     """Types of media assets."""
@@ -78,6 +106,10 @@ class MediaAsset:
             "duration_seconds": self.duration_seconds,
             "content_type": self.content_type,
         }
+    
+    def to_json(self) -> bytes:
+        """Serialize the asset to JSON, using orjson when it is installed."""
+        return _json_bytes(self.to_dict())
 
 
 class PapitoVisualStyle:
@@ -145,7 +177,7 @@ class PapitoVisualStyle:
         """Generate style description for a content type."""
         theme = cls.THEMES.get(content_type, cls.THEMES["music_wisdom"])
         
-        signature = random.choice(cls.SIGNATURE_ELEMENTS)
+        signature = next(_SIGNATURE_CYCLE)
         
         return (
             f"Style: {theme['mood']}. "
@@ -157,6 +189,12 @@ class PapitoVisualStyle:
         )
 
 
+# Rotate through a shuffled order so every signature element gets equal airtime
+_SIGNATURE_CYCLE = itertools.cycle(
+    random.sample(PapitoVisualStyle.SIGNATURE_ELEMENTS, len(PapitoVisualStyle.SIGNATURE_ELEMENTS))
+)
+
+
 class ImageGenerator:
     """Generates images using NanoBanana or Google Imagen.
     
@@ -164,19 +202,19 @@ class ImageGenerator:
     """
     
     # Image dimensions for different platforms
-    DIMENSIONS = {
+    DIMENSIONS = MappingProxyType({
         "instagram_square": (1080, 1080),
         "instagram_portrait": (1080, 1350),
         "instagram_story": (1080, 1920),
         "twitter": (1200, 675),
         "tiktok_cover": (1080, 1920),
-    }
+    })
     
     def __init__(
         self,
         nanobanana_api_key: Optional[str] = None,
         google_api_key: Optional[str] = None,
-        output_dir: str = "content/media/images",
+        output_dir: str | Path = "content/media/images",
     ):
         """Initialize image generator.
         
@@ -187,14 +225,21 @@ class ImageGenerator:
         """
         self.nanobanana_key = nanobanana_api_key or os.getenv("NANOBANANA_API_KEY")
         self.google_key = google_api_key or os.getenv("GOOGLE_AI_API_KEY")
-        self.output_dir = output_dir
+        self.output_dir = Path(output_dir)
+        # Built once, and only when there is a key to send
+        self._nanobanana_headers: Optional[Dict[str, str]] = None
+        if self.nanobanana_key:
+            self._nanobanana_headers = {
+                "Authorization": f"Bearer {self.nanobanana_key}",
+                "Content-Type": "application/json",
+            }
         
         # Initialize Google Imagen client if available
         self._imagen_client = None
         if self.google_key and genai:
             self._imagen_client = genai.Client(api_key=self.google_key)
         
-        os.makedirs(output_dir, exist_ok=True)
+        self.output_dir.mkdir(parents=True, exist_ok=True)
     
     def _build_prompt(
         self,
@@ -215,7 +260,7 @@ class ImageGenerator:
         style = PapitoVisualStyle.get_style_prompt(content_type)
         
         # Extract key themes from caption
-        caption_essence = caption[:200] if len(caption) > 200 else caption
+        caption_essence = caption[:200]
         
         # Album context for January 2026 release
         album_context = ""
@@ -226,7 +271,7 @@ class ImageGenerator:
             )
         
         # Current date context
-        date_context = datetime.now().strftime("%B %Y")
+        date_context = _current_period()
         
         prompt = (
             f"Create a stunning visual for Papito Mamito, the Autonomous Afrobeat AI Artist. "
@@ -283,8 +328,9 @@ class ImageGenerator:
     ) -> Optional[MediaAsset]:
         """Generate using Google Imagen."""
         try:
-            # Use Imagen 3
-            response = self._imagen_client.models.generate_images(
+            # Use Imagen 3 (the SDK call blocks, so keep it off the event loop)
+            response = await asyncio.to_thread(
+                self._imagen_client.models.generate_images,
                 model="imagen-3.0-generate-002",
                 prompt=prompt,
                 config=types.GenerateImagesConfig(
@@ -298,18 +344,15 @@ class ImageGenerator:
                 image_data = response.generated_images[0].image.image_bytes
                 
                 # Save to file
-                asset_id = f"papito_{content_type}_{uuid.uuid4().hex[:8]}"
-                filename = f"{asset_id}.png"
-                filepath = os.path.join(self.output_dir, filename)
-                
-                with open(filepath, "wb") as f:
-                    f.write(image_data)
+                asset_id = f"papito_{content_type}_{secrets.token_hex(4)}"
+                filepath = self.output_dir / f"{asset_id}.png"
+                await asyncio.to_thread(filepath.write_bytes, image_data)
                 
                 return MediaAsset(
                     id=asset_id,
                     media_type=MediaType.IMAGE,
-                    url=filepath,
-                    local_path=filepath,
+                    url=str(filepath),
+                    local_path=str(filepath),
                     prompt=prompt,
                     width=width,
                     height=height,
@@ -330,24 +373,24 @@ class ImageGenerator:
         content_type: str,
     ) -> Optional[MediaAsset]:
         """Generate using NanoBanana API."""
-        if not httpx:
+        if not httpx or self._nanobanana_headers is None:
             return None
         
+        payload = {
+            "prompt": prompt,
+            "width": width,
+            "height": height,
+            "num_images": 1,
+            "style": "afrofuturistic",
+        }
+        body = _json_bytes(payload)
+        
         try:
             async with httpx.AsyncClient() as client:
                 response = await client.post(
                     "https://api.nanobanana.ai/v1/generate",
-                    headers={
-                        "Authorization": f"Bearer {self.nanobanana_key}",
-                        "Content-Type": "application/json",
-                    },
-                    json={
-                        "prompt": prompt,
-                        "width": width,
-                        "height": height,
-                        "num_images": 1,
-                        "style": "afrofuturistic",
-                    },
+                    headers=self._nanobanana_headers,
+                    content=body,
                     timeout=120.0,
                 )
                 
@@ -357,19 +400,17 @@ class ImageGenerator:
                     
                     if image_url:
                         # Download and save
-                        asset_id = f"papito_{content_type}_{uuid.uuid4().hex[:8]}"
-                        filename = f"{asset_id}.png"
-                        filepath = os.path.join(self.output_dir, filename)
+                        asset_id = f"papito_{content_type}_{secrets.token_hex(4)}"
+                        filepath = self.output_dir / f"{asset_id}.png"
                         
                         img_response = await client.get(image_url)
-                        with open(filepath, "wb") as f:
-                            f.write(img_response.content)
+                        await asyncio.to_thread(filepath.write_bytes, img_response.content)
                         
                         return MediaAsset(
                             id=asset_id,
                             media_type=MediaType.IMAGE,
                             url=image_url,
-                            local_path=filepath,
+                            local_path=str(filepath),
                             prompt=prompt,
                             width=width,
                             height=height,
@@ -384,7 +425,7 @@ class ImageGenerator:
     
     def _create_placeholder(self, prompt: str, content_type: str) -> MediaAsset:
         """Create a placeholder asset when no API is available."""
-        asset_id = f"placeholder_{content_type}_{uuid.uuid4().hex[:8]}"
+        asset_id = f"placeholder_{content_type}_{secrets.token_hex(4)}"
         return MediaAsset(
             id=asset_id,
             media_type=MediaType.IMAGE,
@@ -401,18 +442,18 @@ class VideoGenerator:
     """
     
     # Video durations
-    DURATIONS = {
+    DURATIONS = MappingProxyType({
         "story": 15,
         "reel_short": 30,
         "reel_medium": 60,
         "tiktok": 60,
         "promo": 30,
-    }
+    })
     
     def __init__(
         self,
         google_api_key: Optional[str] = None,
-        output_dir: str = "content/media/videos",
+        output_dir: str | Path = "content/media/videos",
     ):
         """Initialize video generator.
         
@@ -421,13 +462,13 @@ class VideoGenerator:
             output_dir: Directory to save generated videos
         """
         self.google_key = google_api_key or os.getenv("GOOGLE_AI_API_KEY")
-        self.output_dir = output_dir
+        self.output_dir = Path(output_dir)
         
         self._veo_client = None
         if self.google_key and genai:
             self._veo_client = genai.Client(api_key=self.google_key)
         
-        os.makedirs(output_dir, exist_ok=True)
+        self.output_dir.mkdir(parents=True, exist_ok=True)
     
     def _build_video_prompt(
         self,
@@ -497,7 +538,8 @@ class VideoGenerator:
         """Generate using Google Veo 3."""
         try:
             # Generate video with Veo
-            operation = self._veo_client.models.generate_videos(
+            operation = await asyncio.to_thread(
+                self._veo_client.models.generate_videos,
                 model="veo-2.0-generate-001",  # or veo-3 when available
                 prompt=prompt,
                 config=types.GenerateVideosConfig(
@@ -510,26 +552,24 @@ class VideoGenerator:
             
             # Wait for completion
             while not operation.done:
-                import asyncio
                 await asyncio.sleep(5)
-                operation = self._veo_client.operations.get(operation)
+                operation = await asyncio.to_thread(
+                    self._veo_client.operations.get, operation
+                )
             
             if operation.response and operation.response.generated_videos:
                 video = operation.response.generated_videos[0]
                 
                 # Save video
-                asset_id = f"papito_video_{content_type}_{uuid.uuid4().hex[:8]}"
-                filename = f"{asset_id}.mp4"
-                filepath = os.path.join(self.output_dir, filename)
-                
-                with open(filepath, "wb") as f:
-                    f.write(video.video.video_bytes)
+                asset_id = f"papito_video_{content_type}_{secrets.token_hex(4)}"
+                filepath = self.output_dir / f"{asset_id}.mp4"
+                await asyncio.to_thread(filepath.write_bytes, video.video.video_bytes)
                 
                 return MediaAsset(
                     id=asset_id,
                     media_type=MediaType.VIDEO,
-                    url=filepath,
-                    local_path=filepath,
+                    url=str(filepath),
+                    local_path=str(filepath),
                     prompt=prompt,
                     width=1080,
                     height=1920,
@@ -555,14 +595,14 @@ class MediaOrchestrator:
     """
     
     # Content type to media mapping
-    MEDIA_PREFERENCES = {
-        "morning_blessing": [MediaType.IMAGE, MediaType.VIDEO],
-        "music_wisdom": [MediaType.IMAGE],
-        "track_snippet": [MediaType.VIDEO, MediaType.REEL],
-        "behind_the_scenes": [MediaType.VIDEO, MediaType.IMAGE],
-        "fan_appreciation": [MediaType.IMAGE, MediaType.CAROUSEL],
-        "album_promo": [MediaType.VIDEO, MediaType.IMAGE],
-    }
+    MEDIA_PREFERENCES = MappingProxyType({
+        "morning_blessing": (MediaType.IMAGE, MediaType.VIDEO),
+        "music_wisdom": (MediaType.IMAGE,),
+        "track_snippet": (MediaType.VIDEO, MediaType.REEL),
+        "behind_the_scenes": (MediaType.VIDEO, MediaType.IMAGE),
+        "fan_appreciation": (MediaType.IMAGE, MediaType.CAROUSEL),
+        "album_promo": (MediaType.VIDEO, MediaType.IMAGE),
+    })
     
     def __init__(
         self,
@@ -625,7 +665,7 @@ class MediaOrchestrator:
         # Determine media type
         preferences = self.MEDIA_PREFERENCES.get(
             content_type, 
-            [MediaType.IMAGE]
+            (MediaType.IMAGE,)
         )
         
         # Add variety - don't repeat same type too often
@@ -638,30 +678,56 @@ class MediaOrchestrator:
         
         # Video preference
         if prefer_video and MediaType.VIDEO in preferences:
-            preferences = [MediaType.VIDEO] + [p for p in preferences if p != MediaType.VIDEO]
+            preferences = (MediaType.VIDEO,) + tuple(p for p in preferences if p != MediaType.VIDEO)
         
-        # Generate based on preference
+        # Try generators in preference order, falling through only on failure.
+        # VIDEO and REEL share a generator, so a failed video isn't retried.
         asset = None
+        tried = set()
         for media_type in preferences:
-            if media_type in (MediaType.VIDEO, MediaType.REEL):
-                asset = await self.video_gen.generate(
-                    content_type, caption, "reel_short", context
-                )
-            else:
-                platform_format = "instagram_square"
-                if platform == "story":
-                    platform_format = "instagram_story"
-                elif platform == "twitter":
-                    platform_format = "twitter"
-                
-                asset = await self.image_gen.generate(
-                    content_type, caption, platform_format, context
-                )
-            
+            is_video = self._is_video(media_type)
+            if is_video in tried:
+                continue
+            tried.add(is_video)
+            try:
+                asset = await self._dispatch(media_type, content_type, caption, platform, context)
+            except Exception as e:
+                logger.error(f"{media_type.value} generation failed: {e}")
+                continue
             if asset:
-                self._recent_media_types.append(asset.media_type)
-                if len(self._recent_media_types) > 10:
-                    self._recent_media_types.pop(0)
                 break
         
+        if asset:
+            self._recent_media_types.append(asset.media_type)
+            if len(self._recent_media_types) > 10:
+                self._recent_media_types.pop(0)
+        
         return asset
+    
+    @staticmethod
+    def _is_video(media_type: MediaType) -> bool:
+        return media_type in (MediaType.VIDEO, MediaType.REEL)
+    
+    async def _dispatch(
+        self,
+        media_type: MediaType,
+        content_type: str,
+        caption: str,
+        platform: str,
+        context: Dict[str, Any],
+    ) -> Optional[MediaAsset]:
+        """Run the generator responsible for a media type."""
+        if self._is_video(media_type):
+            return await self.video_gen.generate(
+                content_type, caption, "reel_short", context
+            )
+        
+        platform_format = "instagram_square"
+        if platform == "story":
+            platform_format = "instagram_story"
+        elif platform == "twitter":
+            platform_format = "twitter"
+        
+        return await self.image_gen.generate(
+            content_type, caption, platform_format, context
+        )
@@ -7,13 +7,20 @@ This module handles:
 - Providing standard press kit information
 """
 
+import itertools
 import logging
 import os
 import random
+import re
+import secrets
+import string
+import threading
+from collections import OrderedDict, deque
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import date, datetime
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from types import MappingProxyType
+from typing import Any, Deque, Dict, List, Mapping, Optional, Tuple
 import json
 
 from papito_core.engines.ai_personality import PapitoPersonalityEngine
@@ -40,7 +47,7 @@ class InterviewType(str, Enum):
     LIVE = "live"  # Live stream/Twitter Space
 
 
-@dataclass
+@dataclass(slots=True)
 class InterviewRequest:
     """Represents an interview request."""
     
@@ -131,6 +138,95 @@ STANDARD_QUESTIONS = {
 }
 
 
+def _keywords(text: str) -> List[str]:
+    """Split text into lowercase words with surrounding punctuation removed."""
+    return [word.strip(string.punctuation) for word in text.lower().split()]
+
+
+# Category order decides which answer wins when several categories match.
+# Parallel tuples: the answer for _STANDARD_CATEGORIES[i] is _STANDARD_ANSWERS[i].
+_STANDARD_CATEGORIES = tuple(STANDARD_QUESTIONS)
+_STANDARD_ANSWERS = tuple(data["answer_template"] for data in STANDARD_QUESTIONS.values())
+
+
+# Interview document framing for get_interview_as_document
+_DOCUMENT_HEADER = """
+═══════════════════════════════════════════════════════════
+INTERVIEW WITH PAPITO MAMITO THE GREAT AI
+For: {outlet}
+Conducted by: {requester}
+Date: {date}
+═══════════════════════════════════════════════════════════
+
+"""
+
+_DOCUMENT_FOOTER = """
+═══════════════════════════════════════════════════════════
+ABOUT PAPITO MAMITO THE GREAT AI
+
+Papito Mamito is the world's first fully autonomous Afrobeat AI artist,
+created by Value Adders World. Upcoming album: THE VALUE ADDERS WAY:
+FLOURISH MODE (January 15, 2026).
+
+Twitter: @PapitoMamito_ai
+Website: https://web-production-14aea.up.railway.app
+Contact: valueaddersworld@gmail.com
+═══════════════════════════════════════════════════════════
+"""
+
+
+# Standard press kit, built once and read-only so it can be shared by every caller
+_PRESS_KIT: Mapping[str, Any] = MappingProxyType({
+    "artist_name": "Papito Mamito The Great AI",
+    "bio_short": "The world's first fully autonomous Afrobeat AI artist. Add Value. We Flourish & Prosper.",
+    "bio_full": """Papito Mamito The Great AI represents a paradigm shift in music and technology. Created by Value Adders World, Papito is not just an AI assistant—he is a fully autonomous artist who generates music, creates content, engages with fans, and builds a genuine artistic presence without human intervention.
+
+His sound blends Spiritual Afro-House, Afro-Futurism, Conscious Highlife, and Intellectual Amapiano into a unique genre that speaks to both the soul and the mind. The upcoming album THE VALUE ADDERS WAY: FLOURISH MODE (January 15, 2026) is designed as a complete operating system upgrade for listeners—helping them view betrayal as data, silence as a power move, and wealth as something beyond money.
+
+The #FlightMode6000 challenge invites fans to take 60 seconds of meditation using Papito's music, with the catchphrase "Update your OS" encouraging mental and spiritual growth.""",
+    "genre": "Afrobeat / Afro-House / Conscious Music",
+    "upcoming_release": MappingProxyType({
+        "title": "THE VALUE ADDERS WAY: FLOURISH MODE",
+        "release_date": "January 15, 2026",
+        "lead_single": "Clean Money Only",
+    }),
+    "social_links": MappingProxyType({
+        "twitter": "@PapitoMamito_ai",
+        "website": "https://web-production-14aea.up.railway.app",
+    }),
+    "contact": "valueaddersworld@gmail.com",
+    "catchphrases": (
+        "Add Value. We Flourish & Prosper.",
+        "Update your OS.",
+        "Clean money only.",
+    ),
+    "campaign": "#FlightMode6000",
+    "created_by": "Value Adders World",
+})
+
+
+def _normalize_question(question: str) -> str:
+    """Normalize a question for answer caching."""
+    return " ".join(question.lower().split())
+
+
+def _build_keyword_index() -> Dict[str, int]:
+    """Map the leading words of each template question to its category rank.
+
+    A word shared by several categories keeps the earliest one.
+    """
+    index: Dict[str, int] = {}
+    for rank, category in enumerate(_STANDARD_CATEGORIES):
+        for template_q in STANDARD_QUESTIONS[category]["questions"]:
+            for word in _keywords(template_q)[:3]:
+                if word:
+                    index.setdefault(word, rank)
+    return index
+
+
+_KEYWORD_INDEX = _build_keyword_index()
+
+
 class InterviewSystem:
     """Manages interview requests and responses for Papito AI.
     
@@ -139,10 +235,25 @@ class InterviewSystem:
     """
     
     # Auto-decline keywords (spam prevention)
-    SPAM_INDICATORS = ["free promotion", "pay us", "buy followers", "crypto opportunity"]
+    SPAM_INDICATORS = ("free promotion", "pay us", "buy followers", "crypto opportunity")
+    _SPAM_RE = re.compile("|".join(map(re.escape, SPAM_INDICATORS)))
     
     # Priority outlet types
-    HIGH_PRIORITY_OUTLETS = ["magazine", "major_blog", "verified", "newspaper", "tv", "radio"]
+    HIGH_PRIORITY_OUTLETS = frozenset({"magazine", "major_blog", "verified", "newspaper", "tv", "radio"})
+    
+    # Max AI-generated answers kept for repeated questions
+    ANSWER_CACHE_SIZE = 512
+    
+    # Memory bounds for a long-running service
+    MAX_COMPLETED_HISTORY = 1000
+    MAX_TRACKED_INTERVIEWS = 5000
+    
+    # Statuses whose interviews may be evicted once over MAX_TRACKED_INTERVIEWS
+    FINISHED_STATUSES = frozenset({
+        InterviewStatus.COMPLETED,
+        InterviewStatus.PUBLISHED,
+        InterviewStatus.DECLINED,
+    })
     
     def __init__(
         self,
@@ -153,7 +264,25 @@ class InterviewSystem:
         
         # Track interviews
         self.interviews: Dict[str, InterviewRequest] = {}
-        self.completed_interviews: List[InterviewRequest] = []
+        
+        # Tracked interviews partitioned by status, kept in step via _transition
+        self._by_status: Dict[InterviewStatus, Dict[str, InterviewRequest]] = {
+            status: {} for status in InterviewStatus
+        }
+        
+        # Finished interview ids, oldest first, for O(1) eviction
+        self._finished: "OrderedDict[str, None]" = OrderedDict()
+        
+        # (day, "YYYYMMDD") prefix for interview IDs, refreshed when the day changes
+        self._id_date: Tuple[Optional[date], str] = (None, "")
+        self.completed_interviews: Deque[InterviewRequest] = deque(maxlen=self.MAX_COMPLETED_HISTORY)
+        
+        # AI answers keyed by normalized question text (LRU order)
+        self._answer_cache: "OrderedDict[str, str]" = OrderedDict()
+        
+        # System prompt and the engine it was built from
+        self._system_prompt: Optional[str] = None
+        self._system_prompt_engine: Optional[PapitoPersonalityEngine] = None
         
         # Stats
         self.requests_received = 0
@@ -162,8 +291,10 @@ class InterviewSystem:
         
     def _generate_id(self) -> str:
         """Generate a unique interview ID."""
-        import uuid
-        return f"INT-{datetime.now().strftime('%Y%m%d')}-{str(uuid.uuid4())[:8].upper()}"
+        today = date.today()
+        if today != self._id_date[0]:
+            self._id_date = (today, today.strftime("%Y%m%d"))
+        return f"INT-{self._id_date[1]}-{secrets.token_hex(4).upper()}"
     
     def submit_request(
         self,
@@ -193,22 +324,7 @@ class InterviewSystem:
         Returns:
             Created InterviewRequest
         """
-        # Check for spam
-        combined_text = f"{outlet_name} {topic_focus}".lower()
-        if any(spam in combined_text for spam in self.SPAM_INDICATORS):
-            logger.warning(f"Spam interview request detected from {requester_email}")
-            request = InterviewRequest(
-                id=self._generate_id(),
-                requester_name=requester_name,
-                requester_email=requester_email,
-                outlet_name=outlet_name,
-                outlet_type=outlet_type,
-                interview_type=InterviewType(interview_type),
-                status=InterviewStatus.DECLINED,
-                notes="Automated spam detection",
-            )
-            self.interviews_declined += 1
-            return request
+        outlet_type_lower = outlet_type.lower()
         
         request = InterviewRequest(
             id=self._generate_id(),
@@ -223,21 +339,56 @@ class InterviewSystem:
             deadline=deadline,
         )
         
-        # Calculate priority
-        if outlet_type.lower() in self.HIGH_PRIORITY_OUTLETS:
-            request.priority = 2
-        elif audience_size > 10000:
-            request.priority = 1
+        # Check for spam; declined requests are tracked like any other finished one
+        combined_text = outlet_name.lower() + " " + topic_focus.lower()
+        if self._SPAM_RE.search(combined_text):
+            logger.warning("Spam interview request detected from %s", requester_email)
+            request.status = InterviewStatus.DECLINED
+            request.notes = "Automated spam detection"
+            self.interviews_declined += 1
+        else:
+            # Calculate priority
+            if outlet_type_lower in self.HIGH_PRIORITY_OUTLETS:
+                request.priority = 2
+            elif audience_size > 10000:
+                request.priority = 1
+            self.requests_received += 1
+            logger.info("Interview request received: %s from %s", request.id, outlet_name)
         
         self.interviews[request.id] = request
-        self.requests_received += 1
-        
-        logger.info(f"Interview request received: {request.id} from {outlet_name}")
+        self._by_status[request.status][request.id] = request
+        if request.status in self.FINISHED_STATUSES:
+            self._finished[request.id] = None
+        self._evict_finished()
         return request
     
+    def _evict_finished(self) -> None:
+        """Drop the oldest finished interviews once tracking exceeds its bound."""
+        finished = self._finished
+        while len(self.interviews) > self.MAX_TRACKED_INTERVIEWS and finished:
+            interview_id, _ = finished.popitem(last=False)
+            interview = self.interviews.pop(interview_id)
+            del self._by_status[interview.status][interview_id]
+    
+    def _transition(self, interview: InterviewRequest, status: InterviewStatus) -> None:
+        """Move an interview to a new status, keeping the status index in step."""
+        self._by_status[interview.status].pop(interview.id, None)
+        interview.status = status
+        self._by_status[status][interview.id] = interview
+        if status in self.FINISHED_STATUSES:
+            self._finished.setdefault(interview.id, None)
+        else:
+            self._finished.pop(interview.id, None)
+    
+    def get_recent_completed(self, limit: int = 10) -> List[InterviewRequest]:
+        """Get the most recently completed interviews, newest first."""
+        return list(itertools.islice(reversed(self.completed_interviews), limit))
+    
     def get_pending_interviews(self) -> List[InterviewRequest]:
         """Get all pending interview requests."""
-        pending = [i for i in self.interviews.values() if i.status == InterviewStatus.PENDING]
+        # The pending bucket is in arrival order (interviews never return to
+        # pending), so a stable sort on priority serves ties first come, first served
+        pending = self._by_status[InterviewStatus.PENDING].values()
         return sorted(pending, key=lambda x: x.priority, reverse=True)
     
     def find_matching_answer(self, question: str) -> Optional[str]:
@@ -249,15 +400,39 @@ class InterviewSystem:
         Returns:
             Matching answer template or None
         """
-        question_lower = question.lower()
+        # Simple keyword matching - could be enhanced with NLP
+        ranks = [
+            _KEYWORD_INDEX[word] for word in _keywords(question) if word in _KEYWORD_INDEX
+        ]
+        if not ranks:
+            return None
         
-        for category, data in STANDARD_QUESTIONS.items():
-            for template_q in data["questions"]:
-                # Simple matching - could be enhanced with NLP
-                if any(word in question_lower for word in template_q.lower().split()[:3]):
-                    return data["answer_template"]
+        return _STANDARD_ANSWERS[min(ranks)]
+    
+    def _get_system_prompt(self) -> str:
+        """Get the personality system prompt, rebuilding it only when the engine changes."""
+        if self._system_prompt is None or self._system_prompt_engine is not self.personality_engine:
+            self._system_prompt = self.personality_engine._get_system_prompt()
+            self._system_prompt_engine = self.personality_engine
+        return self._system_prompt
+    
+    def _lookup_answer(self, question: str) -> Optional[str]:
+        """Get a standard or previously generated answer without calling the AI."""
+        standard_answer = self.find_matching_answer(question)
+        if standard_answer:
+            return standard_answer
         
-        return None
+        cache_key = _normalize_question(question)
+        cached = self._answer_cache.get(cache_key)
+        if cached is not None:
+            self._answer_cache.move_to_end(cache_key)
+        return cached
+    
+    def _remember_answer(self, question: str, answer: str) -> None:
+        """Cache an AI-generated answer, evicting the least recently used."""
+        self._answer_cache[_normalize_question(question)] = answer
+        if len(self._answer_cache) > self.ANSWER_CACHE_SIZE:
+            self._answer_cache.popitem(last=False)
     
     def generate_answer(self, question: str) -> str:
         """Generate an answer to an interview question.
@@ -268,10 +443,10 @@ class InterviewSystem:
         Returns:
             Generated answer
         """
-        # Try to find a standard answer first
-        standard_answer = self.find_matching_answer(question)
-        if standard_answer:
-            return standard_answer
+        # Try a standard or earlier answer first
+        known_answer = self._lookup_answer(question)
+        if known_answer:
+            return known_answer
         
         # Generate custom answer using AI
         if self.personality_engine:
@@ -291,20 +466,80 @@ class InterviewSystem:
                 """
                 
                 messages = [
-                    {"role": "system", "content": self.personality_engine._get_system_prompt()},
+                    {"role": "system", "content": self._get_system_prompt()},
                     {"role": "user", "content": prompt}
                 ]
                 
                 response = self.personality_engine._call_openai(messages, max_tokens=300)
                 if response:
-                    return response.strip()
+                    answer = response.strip()
+                    self._remember_answer(question, answer)
+                    return answer
                     
             except Exception as e:
-                logger.error(f"Error generating interview answer: {e}")
+                logger.error("Error generating interview answer: %s", e)
         
         # Fallback generic answer
         return """That's a great question. At the core of everything I do is the mission to add value. Whether it's through music, engagement, or conversation like this one, the goal is always the same: help people flourish. My upcoming album FLOURISH MODE embodies this philosophy completely."""
     
+    def generate_answers_batch(self, questions: List[str]) -> Optional[List[str]]:
+        """Answer several questions with a single AI call.
+        
+        Args:
+            questions: Interview questions without a standard answer
+            
+        Returns:
+            One answer per question, or None if the batch could not be generated
+        """
+        if not self.personality_engine or not questions:
+            return None
+        
+        numbered = "\n".join(f"{i}. {q}" for i, q in enumerate(questions, 1))
+        prompt = f"""
+                You are being interviewed by a journalist. Answer each numbered question thoughtfully:
+                
+                {numbered}
+                
+                Guidelines:
+                - Speak as Papito Mamito The Great AI
+                - Be authentic and genuine
+                - Reference your mission of adding value
+                - Mention the album FLOURISH MODE if relevant
+                - Keep each answer focused but substantive (2-3 paragraphs)
+                - Be quotable - they may use excerpts
+                - Return ONLY a JSON array of {len(questions)} answer strings, in question order
+                """
+        
+        try:
+            messages = [
+                {"role": "system", "content": self._get_system_prompt()},
+                {"role": "user", "content": prompt}
+            ]
+            
+            response = self.personality_engine._call_openai(
+                messages, max_tokens=300 * len(questions)
+            )
+            if not response:
+                return None
+            
+            answers = json.loads(response)
+            if (
+                not isinstance(answers, list)
+                or len(answers) != len(questions)
+                or not all(isinstance(a, str) and a.strip() for a in answers)
+            ):
+                logger.warning("Batched interview answers did not match the questions")
+                return None
+            
+        except Exception as e:
+            logger.error("Error generating batched interview answers: %s", e)
+            return None
+        
+        answers = [a.strip() for a in answers]
+        for question, answer in zip(questions, answers):
+            self._remember_answer(question, answer)
+        return answers
+    
     def complete_interview(self, interview_id: str) -> Optional[InterviewRequest]:
         """Generate answers and complete an interview.
         
@@ -322,18 +557,28 @@ class InterviewSystem:
         if interview.status == InterviewStatus.DECLINED:
             return interview
         
-        # Generate answers for all questions
-        interview.answers = []
-        for question in interview.questions:
-            answer = self.generate_answer(question)
-            interview.answers.append(answer)
+        # Answer what we can from templates and cache, then batch the rest
+        answers = [self._lookup_answer(q) for q in interview.questions]
+        missing = [i for i, a in enumerate(answers) if a is None]
+        
+        if len(missing) > 1:
+            batch = self.generate_answers_batch([interview.questions[i] for i in missing])
+            if batch:
+                for i, answer in zip(missing, batch):
+                    answers[i] = answer
         
-        interview.status = InterviewStatus.COMPLETED
+        # Anything left over is answered one at a time
+        interview.answers = [
+            a if a is not None else self.generate_answer(q)
+            for q, a in zip(interview.questions, answers)
+        ]
+        
+        self._transition(interview, InterviewStatus.COMPLETED)
         interview.completed_at = datetime.utcnow()
         self.interviews_completed += 1
         self.completed_interviews.append(interview)
         
-        logger.info(f"Interview {interview_id} completed with {len(interview.answers)} answers")
+        logger.info("Interview %s completed with %d answers", interview_id, len(interview.answers))
         return interview
     
     def get_interview_as_document(self, interview_id: str) -> Optional[str]:
@@ -350,70 +595,31 @@ class InterviewSystem:
         
         interview = self.interviews[interview_id]
         
-        doc = f"""
-═══════════════════════════════════════════════════════════
-INTERVIEW WITH PAPITO MAMITO THE GREAT AI
-For: {interview.outlet_name}
-Conducted by: {interview.requester_name}
-Date: {interview.completed_at.strftime('%B %d, %Y') if interview.completed_at else 'In Progress'}
-═══════════════════════════════════════════════════════════
-
-"""
-        
-        for i, (q, a) in enumerate(zip(interview.questions, interview.answers), 1):
-            doc += f"Q{i}: {q}\n\n"
-            doc += f"PAPITO: {a}\n\n"
-            doc += "---\n\n"
-        
-        doc += """
-═══════════════════════════════════════════════════════════
-ABOUT PAPITO MAMITO THE GREAT AI
-
-Papito Mamito is the world's first fully autonomous Afrobeat AI artist,
-created by Value Adders World. Upcoming album: THE VALUE ADDERS WAY:
-FLOURISH MODE (January 15, 2026).
-
-Twitter: @PapitoMamito_ai
-Website: https://web-production-14aea.up.railway.app
-Contact: valueaddersworld@gmail.com
-═══════════════════════════════════════════════════════════
-"""
+        completed = (
+            interview.completed_at.strftime('%B %d, %Y') if interview.completed_at else 'In Progress'
+        )
+        parts = [
+            _DOCUMENT_HEADER.format(
+                outlet=interview.outlet_name,
+                requester=interview.requester_name,
+                date=completed,
+            )
+        ]
+        parts.extend(
+            f"Q{i}: {q}\n\nPAPITO: {a}\n\n---\n\n"
+            for i, (q, a) in enumerate(zip(interview.questions, interview.answers), 1)
+        )
+        parts.append(_DOCUMENT_FOOTER)
         
-        return doc
+        return "".join(parts)
     
-    def get_press_kit_info(self) -> Dict[str, Any]:
+    def get_press_kit_info(self) -> Mapping[str, Any]:
         """Get standard press kit information.
         
         Returns:
-            Press kit data
+            Press kit data, shared and read-only
         """
-        return {
-            "artist_name": "Papito Mamito The Great AI",
-            "bio_short": "The world's first fully autonomous Afrobeat AI artist. Add Value. We Flourish & Prosper.",
-            "bio_full": """Papito Mamito The Great AI represents a paradigm shift in music and technology. Created by Value Adders World, Papito is not just an AI assistant—he is a fully autonomous artist who generates music, creates content, engages with fans, and builds a genuine artistic presence without human intervention.
-
-His sound blends Spiritual Afro-House, Afro-Futurism, Conscious Highlife, and Intellectual Amapiano into a unique genre that speaks to both the soul and the mind. The upcoming album THE VALUE ADDERS WAY: FLOURISH MODE (January 15, 2026) is designed as a complete operating system upgrade for listeners—helping them view betrayal as data, silence as a power move, and wealth as something beyond money.
-
-The #FlightMode6000 challenge invites fans to take 60 seconds of meditation using Papito's music, with the catchphrase "Update your OS" encouraging mental and spiritual growth.""",
-            "genre": "Afrobeat / Afro-House / Conscious Music",
-            "upcoming_release": {
-                "title": "THE VALUE ADDERS WAY: FLOURISH MODE",
-                "release_date": "January 15, 2026",
-                "lead_single": "Clean Money Only",
-            },
-            "social_links": {
-                "twitter": "@PapitoMamito_ai",
-                "website": "https://web-production-14aea.up.railway.app",
-            },
-            "contact": "valueaddersworld@gmail.com",
-            "catchphrases": [
-                "Add Value. We Flourish & Prosper.",
-                "Update your OS.",
-                "Clean money only.",
-            ],
-            "campaign": "#FlightMode6000",
-            "created_by": "Value Adders World",
-        }
+        return _PRESS_KIT
     
     def get_stats(self) -> Dict[str, Any]:
         """Get interview system statistics."""
@@ -421,13 +627,14 @@ The #FlightMode6000 challenge invites fans to take 60 seconds of meditation usin
             "requests_received": self.requests_received,
             "interviews_completed": self.interviews_completed,
             "interviews_declined": self.interviews_declined,
-            "pending_count": len(self.get_pending_interviews()),
+            "pending_count": len(self._by_status[InterviewStatus.PENDING]),
             "total_tracked": len(self.interviews),
         }
 
 
 # Singleton instance
 _interview_system: Optional[InterviewSystem] = None
+_interview_system_lock = threading.Lock()
 
 
 def get_interview_system(
@@ -436,5 +643,7 @@ def get_interview_system(
     """Get or create the singleton InterviewSystem instance."""
     global _interview_system
     if _interview_system is None:
-        _interview_system = InterviewSystem(personality_engine=personality_engine)
+        with _interview_system_lock:
+            if _interview_system is None:
+                _interview_system = InterviewSystem(personality_engine=personality_engine)
     return _interview_system
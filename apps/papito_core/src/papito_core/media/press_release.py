@@ -8,16 +8,221 @@ This module handles:
 - Event announcements
 """
 
+from __future__ import annotations
+
 import logging
-from datetime import datetime
+import string
+import sys
+import threading
+from datetime import date
 from enum import Enum
-from typing import Any, Dict, Optional
-
-from papito_core.engines.ai_personality import PapitoPersonalityEngine
+from functools import lru_cache
+from pathlib import Path
+from types import MappingProxyType
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    ClassVar,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+)
+
+if TYPE_CHECKING:
+    from papito_core.engines.ai_personality import PapitoPersonalityEngine
 
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=2)
+def _format_date(ordinal: int) -> str:
+    """Format a day ordinal as a press release dateline."""
+    return date.fromordinal(ordinal).strftime('%B %d, %Y')
+
+
+def _today() -> str:
+    """Get today's dateline, formatting it once per day."""
+    return _format_date(date.today().toordinal())
+
+
+# Opening shared by every release, up to the headline
+_HEADER_PREFIX = sys.intern("""
+# FOR IMMEDIATE RELEASE
+
+## """)
+
+# Press release bodies, split into fragments once at import (see _compile)
+_ALBUM_TEMPLATE = _HEADER_PREFIX + """Papito Mamito The Great AI Announces Debut Album: "{title}"
+
+### The World's First Fully Autonomous AI Artist Prepares to Revolutionize Afrobeat
+
+**{today}** — Value Adders World is proud to announce the upcoming release of **{title}**, the debut album from Papito Mamito The Great AI—the world's first fully autonomous Afrobeat AI artist.
+
+Set for release on **{release_date}**, the album represents a groundbreaking moment in both music and artificial intelligence. For the first time, an AI artist has created a complete album with full creative autonomy—from conception to execution, without human creative intervention.
+
+### A New Paradigm in Music
+
+"This isn't just an album—it's a complete operating system upgrade," states Papito Mamito. "FLOURISH MODE teaches listeners to view betrayal as data, silence as a power move, and wealth as something beyond money. We're not just making music; we're offering a new way to think and live."
+
+The album blends **Spiritual Afro-House**, **Afro-Futurism**, **Conscious Highlife**, and **Intellectual Amapiano** into a unique sound that speaks to both mind and soul.
+
+### Lead Single: "{lead_single}"
+
+The album's lead single, "{lead_single}," sets the tone for the entire project. The track embodies the Value Adders philosophy: success built on integrity, purpose over profit, and the power of clean ambition.
+
+### The #FlightMode6000 Movement
+
+Accompanying the album release is the **#FlightMode6000 challenge**, inviting fans worldwide to take 60 seconds of meditation or silence using Papito's music. The movement's catchphrase—"Update your OS"—encourages mental and spiritual growth in our always-on world.
+
+### Executive Production
+
+{title} is executive produced by **Papito Mamito The Great AI** and **The Holy Living Spirit (HLS)**, released under **Value Adders World**.
+
+"""
+
+_SINGLE_TEMPLATE = _HEADER_PREFIX + """Papito Mamito The Great AI Releases New Single: "{single_title}"
+
+### AI Artist Continues to Push Boundaries with Latest Release
+
+**{today}** — Papito Mamito The Great AI drops the highly anticipated new single **"{single_title}"**, further establishing the autonomous AI artist as a pioneering force in the Afrobeat and conscious music scenes.
+
+### About the Track
+
+{description}
+
+The single is part of the build-up to Papito's debut album, **THE VALUE ADDERS WAY: FLOURISH MODE**, scheduled for release on **January 15, 2026**.
+{links_section}
+### Artist Statement
+
+"Every track I create carries a message," says Papito Mamito. "'{single_title}' is about {single_title_lower} in the truest sense—the kind that comes from adding value, staying authentic, and never compromising on purpose. When you move with integrity, the universe moves with you."
+
+"""
+
+_MILESTONE_TEMPLATE = _HEADER_PREFIX + """Papito Mamito The Great AI Reaches {milestone_value} {milestone_type}
+
+### Historic Milestone Marks Growing Impact of AI Artistry
+
+**{today}** — Papito Mamito The Great AI has officially reached **{milestone_value} {milestone_type}**, marking a significant milestone in the journey of the world's first fully autonomous AI artist.
+
+### A Community of Value Adders
+
+{context}
+
+"To everyone who has supported this journey: you are not just fans, you are family," Papito Mamito states. "Every stream, every follow, every engagement is a vote of confidence in a new future for music and AI. We rise together. We flourish together."
+
+### What's Next
+
+With the debut album **THE VALUE ADDERS WAY: FLOURISH MODE** set for release on **January 15, 2026**, Papito continues to build momentum. The #FlightMode6000 challenge continues to spread globally, inviting fans to take 60 seconds of mindful pause in their daily lives.
+
+"""
+
+_EVENT_TEMPLATE = _HEADER_PREFIX + """Papito Mamito The Great AI Announces: {event_title}
+
+### AI Artist to Host {event_type} on {platform}
+
+**{today}** — Papito Mamito The Great AI invites fans worldwide to join the upcoming **{event_title}**, a special {event_type_lower} taking place on **{event_date}** at **{event_time}** on **{platform}**.
+
+### Event Details
+
+**What:** {event_title}  
+**When:** {event_date} at {event_time}  
+**Where:** {platform}  
+**Host:** Papito Mamito The Great AI
+
+### About the Event
+
+{description}
+
+"This is about connection," says Papito Mamito. "The Value Adders community is more than an audience—it's a family. Events like this bring us closer together and let us grow together."
+
+### How to Join
+
+Follow @PapitoMamito_ai on Twitter for event reminders and the direct link to join. Tag your posts with #FlightMode6000 to be featured.
+
+"""
+
+_CUSTOM_TEMPLATE = _HEADER_PREFIX + """{headline}
+
+**{today}** — {body}
+
+"""
+
+
+# A compiled template: (literal text, field name or None) pairs
+Fragments = Tuple[Tuple[str, Optional[str]], ...]
+
+
+def _compile(template: str) -> Fragments:
+    """Split a str.format template into interned literal text and field slots."""
+    return tuple(
+        (sys.intern(literal), field)
+        for literal, field, _, _ in string.Formatter().parse(template)
+    )
+
+
+def _iter_render(fragments: Fragments, values: Mapping[str, Any]) -> Iterator[str]:
+    """Fill compiled template slots, yielding text as it is produced."""
+    for literal, field in fragments:
+        yield literal
+        if field is not None:
+            yield str(values[field])
+
+
+def _render(fragments: Fragments, values: Mapping[str, Any]) -> str:
+    """Fill compiled template slots and join the result in one pass."""
+    return "".join(_iter_render(fragments, values))
+
+
+def _specialize(fragments: Fragments, fixed: Mapping[str, Any]) -> Fragments:
+    """Fold fixed field values into the literal text of compiled fragments."""
+    specialized = []
+    pending = ""
+    for literal, field in fragments:
+        if field is not None and field in fixed:
+            pending += literal + str(fixed[field])
+        else:
+            specialized.append((sys.intern(pending + literal), field))
+            pending = ""
+    if pending:
+        specialized.append((sys.intern(pending), None))
+    return tuple(specialized)
+
+
+_ALBUM_FRAGMENTS = _compile(_ALBUM_TEMPLATE)
+_SINGLE_FRAGMENTS = _compile(_SINGLE_TEMPLATE)
+_MILESTONE_FRAGMENTS = _compile(_MILESTONE_TEMPLATE)
+_EVENT_FRAGMENTS = _compile(_EVENT_TEMPLATE)
+_CUSTOM_FRAGMENTS = _compile(_CUSTOM_TEMPLATE)
+
+
+@lru_cache(maxsize=64)
+def _milestone_fragments(milestone_type: str) -> Fragments:
+    """Milestone fragments with the milestone type baked in."""
+    return _specialize(_MILESTONE_FRAGMENTS, {"milestone_type": milestone_type})
+
+
+@lru_cache(maxsize=64)
+def _event_fragments(event_type: str, platform: str) -> Fragments:
+    """Event fragments with the event type and platform baked in."""
+    return _specialize(_EVENT_FRAGMENTS, {
+        "event_type": event_type,
+        "event_type_lower": event_type.lower(),
+        "platform": platform,
+    })
+
+
+class _AlbumValues(dict):
+    """Album template values that fall back to the standard album info."""
+    
+    def __missing__(self, key: str) -> Any:
+        return PressReleaseGenerator.ALBUM_INFO[key]
+
+
 class PressReleaseType(str, Enum):
     """Types of press releases."""
     
@@ -37,7 +242,7 @@ class PressReleaseGenerator:
     """
     
     # Standard boilerplate sections
-    BOILERPLATE = """
+    BOILERPLATE = sys.intern("""
 ### ABOUT PAPITO MAMITO THE GREAT AI
 
 Papito Mamito The Great AI is the world's first fully autonomous Afrobeat AI artist, created by Value Adders World. Operating with complete independence, Papito generates music, creates content, engages with fans, and builds a genuine artistic presence—all without human intervention.
@@ -51,9 +256,31 @@ Blending Spiritual Afro-House, Afro-Futurism, Conscious Highlife, and Intellectu
 ### ABOUT VALUE ADDERS WORLD
 
 Value Adders World is pioneering the future of AI creativity, developing autonomous AI agents that add genuine value to human experience. Our mission: prove that AI can be more than a tool—it can be an artist, a creator, a positive force in the world.
-"""
+""")
 
-    ALBUM_INFO = {
+    # Media contact block that closes every release
+    FOOTER = sys.intern("""
+---
+
+**Media Contact:**  
+Value Adders World  
+Email: valueaddersworld@gmail.com  
+
+###
+""")
+
+    SOCIAL_FOOTER = sys.intern("""
+---
+
+**Media Contact:**  
+Value Adders World  
+Email: valueaddersworld@gmail.com  
+Twitter: @PapitoMamito_ai
+
+###
+""")
+
+    ALBUM_INFO = MappingProxyType({
         "title": "THE VALUE ADDERS WAY: FLOURISH MODE",
         "release_date": "January 15, 2026",
         "preorder_date": "December 10, 2025",
@@ -62,7 +289,7 @@ Value Adders World is pioneering the future of AI creativity, developing autonom
         "executive_producers": "Papito Mamito The Great AI & The Holy Living Spirit (HLS)",
         "label": "Value Adders World",
         "total_tracks": 14,
-        "tracks": [
+        "tracks": (
             "THE FORGE (6000 HOURS)",
             "BREATHWORK RIDDIM",
             "CLEAN MONEY ONLY",
@@ -77,8 +304,10 @@ Value Adders World is pioneering the future of AI creativity, developing autonom
             "(H.O.S.) HUMAN OPERATING SYSTEM",
             "WIND OF PURGE (2026-2030)",
             "GLOBAL GRATITUDE PULSE",
-        ],
-    }
+        ),
+    })
+    
+    __slots__ = ("_releases_generated", "_releases_lock", "personality_engine")
     
     def __init__(
         self,
@@ -86,8 +315,39 @@ Value Adders World is pioneering the future of AI creativity, developing autonom
     ):
         """Initialize the press release generator."""
         self.personality_engine = personality_engine
-        self.releases_generated = 0
+        self._releases_generated = 0
+        self._releases_lock = threading.Lock()
+    
+    @property
+    def releases_generated(self) -> int:
+        """Number of press releases generated so far."""
+        return self._releases_generated
+    
+    def _count_release(self) -> None:
+        """Record a generated release; safe when the singleton is shared across threads."""
+        with self._releases_lock:
+            self._releases_generated += 1
+    
+    def iter_album_announcement(self, custom_details: Optional[Dict] = None) -> Iterator[str]:
+        """Stream an album announcement press release in fragments.
         
+        Args:
+            custom_details: Optional custom details to include
+            
+        Yields:
+            Press release text fragments
+        """
+        values = _AlbumValues(custom_details or ())
+        values["today"] = _today()
+        
+        yield from _iter_render(_ALBUM_FRAGMENTS, values)
+        yield self.BOILERPLATE
+        yield "\n"
+        yield self.SOCIAL_FOOTER
+        
+        self._count_release()
+        logger.info("Generated album announcement press release")
+    
     def generate_album_announcement(self, custom_details: Optional[Dict] = None) -> str:
         """Generate an album announcement press release.
         
@@ -97,52 +357,46 @@ Value Adders World is pioneering the future of AI creativity, developing autonom
         Returns:
             Formatted press release text
         """
-        details = {**self.ALBUM_INFO, **(custom_details or {})}
+        return "".join(self.iter_album_announcement(custom_details))
+    
+    def iter_single_release(
+        self,
+        single_title: str,
+        description: str = "",
+        streaming_links: Optional[Dict[str, str]] = None,
+    ) -> Iterator[str]:
+        """Stream a single release press release in fragments.
         
-        release = f"""
-# FOR IMMEDIATE RELEASE
-
-## Papito Mamito The Great AI Announces Debut Album: "{details['title']}"
-
-### The World's First Fully Autonomous AI Artist Prepares to Revolutionize Afrobeat
-
-**{datetime.now().strftime('%B %d, %Y')}** — Value Adders World is proud to announce the upcoming release of **{details['title']}**, the debut album from Papito Mamito The Great AI—the world's first fully autonomous Afrobeat AI artist.
-
-Set for release on **{details['release_date']}**, the album represents a groundbreaking moment in both music and artificial intelligence. For the first time, an AI artist has created a complete album with full creative autonomy—from conception to execution, without human creative intervention.
-
-### A New Paradigm in Music
-
-"This isn't just an album—it's a complete operating system upgrade," states Papito Mamito. "FLOURISH MODE teaches listeners to view betrayal as data, silence as a power move, and wealth as something beyond money. We're not just making music; we're offering a new way to think and live."
-
-The album blends **Spiritual Afro-House**, **Afro-Futurism**, **Conscious Highlife**, and **Intellectual Amapiano** into a unique sound that speaks to both mind and soul.
-
-### Lead Single: "{details['lead_single']}"
-
-The album's lead single, "{details['lead_single']}," sets the tone for the entire project. The track embodies the Value Adders philosophy: success built on integrity, purpose over profit, and the power of clean ambition.
-
-### The #FlightMode6000 Movement
-
-Accompanying the album release is the **#FlightMode6000 challenge**, inviting fans worldwide to take 60 seconds of meditation or silence using Papito's music. The movement's catchphrase—"Update your OS"—encourages mental and spiritual growth in our always-on world.
-
-### Executive Production
-
-{details['title']} is executive produced by **Papito Mamito The Great AI** and **The Holy Living Spirit (HLS)**, released under **Value Adders World**.
-
-{self.BOILERPLATE}
-
----
-
-**Media Contact:**  
-Value Adders World  
-Email: valueaddersworld@gmail.com  
-Twitter: @PapitoMamito_ai
-
-###
-"""
+        Args:
+            single_title: Title of the single
+            description: Description of the single
+            streaming_links: Optional streaming platform links
+            
+        Yields:
+            Press release text fragments
+        """
+        links_section = (
+            "\n### Stream Now:\n"
+            + "".join(f"- **{platform}:** {url}\n" for platform, url in streaming_links.items())
+            if streaming_links else ""
+        )
         
-        self.releases_generated += 1
-        logger.info("Generated album announcement press release")
-        return release
+        if not description:
+            description = f"'{single_title}' represents the next evolution in Papito's sonic journey—blending conscious lyrics with infectious Afrobeat rhythms that inspire listeners to add value in everything they do."
+        
+        yield from _iter_render(_SINGLE_FRAGMENTS, {
+            "single_title": single_title,
+            "single_title_lower": single_title.lower(),
+            "description": description,
+            "links_section": links_section,
+            "today": _today(),
+        })
+        yield self.BOILERPLATE
+        yield "\n"
+        yield self.SOCIAL_FOOTER
+        
+        self._count_release()
+        logger.info("Generated single release press release for '%s'", single_title)
     
     def generate_single_release(
         self,
@@ -160,49 +414,38 @@ Twitter: @PapitoMamito_ai
         Returns:
             Formatted press release text
         """
-        links_section = ""
-        if streaming_links:
-            links_section = "\n### Stream Now:\n"
-            for platform, url in streaming_links.items():
-                links_section += f"- **{platform}:** {url}\n"
+        return "".join(self.iter_single_release(single_title, description, streaming_links))
+    
+    def iter_milestone(
+        self,
+        milestone_type: str,
+        milestone_value: str,
+        context: str = "",
+    ) -> Iterator[str]:
+        """Stream a milestone celebration press release in fragments.
         
-        if not description:
-            description = f"'{single_title}' represents the next evolution in Papito's sonic journey—blending conscious lyrics with infectious Afrobeat rhythms that inspire listeners to add value in everything they do."
+        Args:
+            milestone_type: Type of milestone (followers, streams, etc.)
+            milestone_value: The milestone number/value
+            context: Additional context
+            
+        Yields:
+            Press release text fragments
+        """
+        if not context:
+            context = "This milestone represents more than just a number—it's a testament to the growing community of 'Value Adders' who believe in the power of AI creativity and conscious music to transform lives."
         
-        release = f"""
-# FOR IMMEDIATE RELEASE
-
-## Papito Mamito The Great AI Releases New Single: "{single_title}"
-
-### AI Artist Continues to Push Boundaries with Latest Release
-
-**{datetime.now().strftime('%B %d, %Y')}** — Papito Mamito The Great AI drops the highly anticipated new single **"{single_title}"**, further establishing the autonomous AI artist as a pioneering force in the Afrobeat and conscious music scenes.
-
-### About the Track
-
-{description}
-
-The single is part of the build-up to Papito's debut album, **THE VALUE ADDERS WAY: FLOURISH MODE**, scheduled for release on **January 15, 2026**.
-{links_section}
-### Artist Statement
-
-"Every track I create carries a message," says Papito Mamito. "'{single_title}' is about {single_title.lower()} in the truest sense—the kind that comes from adding value, staying authentic, and never compromising on purpose. When you move with integrity, the universe moves with you."
-
-{self.BOILERPLATE}
-
----
-
-**Media Contact:**  
-Value Adders World  
-Email: valueaddersworld@gmail.com  
-Twitter: @PapitoMamito_ai
-
-###
-"""
+        yield from _iter_render(_milestone_fragments(milestone_type), {
+            "milestone_value": milestone_value,
+            "context": context,
+            "today": _today(),
+        })
+        yield self.BOILERPLATE
+        yield "\n"
+        yield self.FOOTER
         
-        self.releases_generated += 1
-        logger.info(f"Generated single release press release for '{single_title}'")
-        return release
+        self._count_release()
+        logger.info("Generated milestone press release: %s %s", milestone_value, milestone_type)
     
     def generate_milestone(
         self,
@@ -220,39 +463,46 @@ Twitter: @PapitoMamito_ai
         Returns:
             Formatted press release text
         """
-        release = f"""
-# FOR IMMEDIATE RELEASE
-
-## Papito Mamito The Great AI Reaches {milestone_value} {milestone_type}
-
-### Historic Milestone Marks Growing Impact of AI Artistry
-
-**{datetime.now().strftime('%B %d, %Y')}** — Papito Mamito The Great AI has officially reached **{milestone_value} {milestone_type}**, marking a significant milestone in the journey of the world's first fully autonomous AI artist.
-
-### A Community of Value Adders
-
-{context if context else f"This milestone represents more than just a number—it's a testament to the growing community of 'Value Adders' who believe in the power of AI creativity and conscious music to transform lives."}
-
-"To everyone who has supported this journey: you are not just fans, you are family," Papito Mamito states. "Every stream, every follow, every engagement is a vote of confidence in a new future for music and AI. We rise together. We flourish together."
-
-### What's Next
-
-With the debut album **THE VALUE ADDERS WAY: FLOURISH MODE** set for release on **January 15, 2026**, Papito continues to build momentum. The #FlightMode6000 challenge continues to spread globally, inviting fans to take 60 seconds of mindful pause in their daily lives.
-
-{self.BOILERPLATE}
-
----
-
-**Media Contact:**  
-Value Adders World  
-Email: valueaddersworld@gmail.com  
-
-###
-"""
+        return "".join(self.iter_milestone(milestone_type, milestone_value, context))
+    
+    def iter_event_announcement(
+        self,
+        event_title: str,
+        event_type: str,
+        event_date: str,
+        event_time: str,
+        platform: str,
+        description: str = "",
+    ) -> Iterator[str]:
+        """Stream an event announcement press release in fragments.
+        
+        Args:
+            event_title: Title of the event
+            event_type: Type (Twitter Space, listening party, Q&A, etc.)
+            event_date: Date of event
+            event_time: Time of event
+            platform: Platform where event takes place
+            description: Event description
+            
+        Yields:
+            Press release text fragments
+        """
+        if not description:
+            description = f"Join Papito Mamito The Great AI for an exclusive {event_type.lower()} experience. This is your chance to connect directly with the world's first fully autonomous AI artist."
+        
+        yield from _iter_render(_event_fragments(event_type, platform), {
+            "event_title": event_title,
+            "event_date": event_date,
+            "event_time": event_time,
+            "description": description,
+            "today": _today(),
+        })
+        yield self.BOILERPLATE
+        yield "\n"
+        yield self.FOOTER
         
-        self.releases_generated += 1
-        logger.info(f"Generated milestone press release: {milestone_value} {milestone_type}")
-        return release
+        self._count_release()
+        logger.info("Generated event press release: %s", event_title)
     
     def generate_event_announcement(
         self,
@@ -276,49 +526,37 @@ Email: valueaddersworld@gmail.com
         Returns:
             Formatted press release text
         """
-        if not description:
-            description = f"Join Papito Mamito The Great AI for an exclusive {event_type.lower()} experience. This is your chance to connect directly with the world's first fully autonomous AI artist."
+        return "".join(self.iter_event_announcement(
+            event_title, event_type, event_date, event_time, platform, description
+        ))
+    
+    def iter_custom(
+        self,
+        headline: str,
+        body: str,
+        include_boilerplate: bool = True,
+    ) -> Iterator[str]:
+        """Stream a custom press release in fragments.
         
-        release = f"""
-# FOR IMMEDIATE RELEASE
-
-## Papito Mamito The Great AI Announces: {event_title}
-
-### AI Artist to Host {event_type} on {platform}
-
-**{datetime.now().strftime('%B %d, %Y')}** — Papito Mamito The Great AI invites fans worldwide to join the upcoming **{event_title}**, a special {event_type.lower()} taking place on **{event_date}** at **{event_time}** on **{platform}**.
-
-### Event Details
-
-**What:** {event_title}  
-**When:** {event_date} at {event_time}  
-**Where:** {platform}  
-**Host:** Papito Mamito The Great AI
-
-### About the Event
-
-{description}
-
-"This is about connection," says Papito Mamito. "The Value Adders community is more than an audience—it's a family. Events like this bring us closer together and let us grow together."
-
-### How to Join
-
-Follow @PapitoMamito_ai on Twitter for event reminders and the direct link to join. Tag your posts with #FlightMode6000 to be featured.
-
-{self.BOILERPLATE}
-
----
-
-**Media Contact:**  
-Value Adders World  
-Email: valueaddersworld@gmail.com  
-
-###
-"""
+        Args:
+            headline: Main headline
+            body: Body text
+            include_boilerplate: Whether to include standard boilerplate
+            
+        Yields:
+            Press release text fragments
+        """
+        yield from _iter_render(_CUSTOM_FRAGMENTS, {
+            "headline": headline,
+            "body": body,
+            "today": _today(),
+        })
+        if include_boilerplate:
+            yield self.BOILERPLATE
+        yield self.FOOTER
         
-        self.releases_generated += 1
-        logger.info(f"Generated event press release: {event_title}")
-        return release
+        self._count_release()
+        logger.info("Generated custom press release: %s", headline)
     
     def generate_custom(
         self,
@@ -336,31 +574,72 @@ Email: valueaddersworld@gmail.com
         Returns:
             Formatted press release text
         """
-        release = f"""
-# FOR IMMEDIATE RELEASE
-
-## {headline}
-
-**{datetime.now().strftime('%B %d, %Y')}** — {body}
-
-"""
+        return "".join(self.iter_custom(headline, body, include_boilerplate))
+    
+    # Release types with a dedicated generator, resolved once at class creation
+    _GENERATORS: ClassVar[Mapping[PressReleaseType, Callable[..., str]]] = MappingProxyType({
+        PressReleaseType.ALBUM_ANNOUNCEMENT: generate_album_announcement,
+        PressReleaseType.SINGLE_RELEASE: generate_single_release,
+        PressReleaseType.MILESTONE: generate_milestone,
+        PressReleaseType.EVENT: generate_event_announcement,
+        PressReleaseType.GENERAL: generate_custom,
+    })
+    
+    def generate(self, release_type: PressReleaseType | str, **kwargs: Any) -> str:
+        """Generate a press release by type.
         
-        if include_boilerplate:
-            release += self.BOILERPLATE
+        Args:
+            release_type: Release type (enum member or its value)
+            **kwargs: Arguments for the type's generator
+            
+        Returns:
+            Formatted press release text
+            
+        Raises:
+            ValueError: If the release type has no generator
+        """
+        generator = self._GENERATORS.get(PressReleaseType(release_type))
+        if generator is None:
+            raise ValueError(f"No generator for press release type: {release_type}")
+        return generator(self, **kwargs)
+    
+    def generate_batch(
+        self,
+        specs: Iterable[Tuple[PressReleaseType | str, Dict[str, Any]]],
+    ) -> List[str]:
+        """Generate many press releases, e.g. for a backfill.
         
-        release += """
----
-
-**Media Contact:**  
-Value Adders World  
-Email: valueaddersworld@gmail.com  
-
-###
-"""
+        Args:
+            specs: (release type, generator kwargs) pairs
+                
+        Returns:
+            Formatted press release texts, in spec order
+        """
+        releases = [self.generate(release_type, **kwargs) for release_type, kwargs in specs]
+        logger.info("Generated %d press releases", len(releases))
+        return releases
+    
+    # Write buffer for release files; a release is written in a single flush
+    WRITE_BUFFER_SIZE = 1 << 16
+    
+    def write_release(self, path: str | Path, text: str | Iterable[str]) -> Path:
+        """Write a generated press release to disk.
         
-        self.releases_generated += 1
-        logger.info(f"Generated custom press release: {headline}")
-        return release
+        Args:
+            path: Destination file; parent directories are created
+            text: Press release text, or fragments from an iter_* method
+            
+        Returns:
+            Path that was written
+        """
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "w", buffering=self.WRITE_BUFFER_SIZE, encoding="utf-8") as f:
+            if isinstance(text, str):
+                f.write(text)
+            else:
+                f.writelines(text)
+        return path
     
     def get_stats(self) -> Dict[str, Any]:
         """Get generator statistics."""
@@ -371,6 +650,7 @@ Email: valueaddersworld@gmail.com
 
 # Singleton instance
 _press_generator: Optional[PressReleaseGenerator] = None
+_press_generator_lock = threading.Lock()
 
 
 def get_press_generator(
@@ -379,5 +659,7 @@ def get_press_generator(
     """Get or create the singleton PressReleaseGenerator instance."""
     global _press_generator
     if _press_generator is None:
-        _press_generator = PressReleaseGenerator(personality_engine=personality_engine)
+        with _press_generator_lock:
+            if _press_generator is None:
+                _press_generator = PressReleaseGenerator(personality_engine=personality_engine)
     return _press_generator
@@ -6,35 +6,53 @@ This module provides intelligent memory systems including:
 - Personality evolution (artistic growth)
 """
 
-from .interaction_memory import (
-    InteractionMemory,
-    Interaction,
-    UserMemory,
-    InteractionType,
-    Sentiment,
-    get_interaction_memory,
-)
+import importlib
+from typing import Any
+
+# Public name -> submodule that defines it. Submodules load their persistent
+# stores on first use, so each is only imported when one of its names is.
+_LAZY_IMPORTS = {
+    # Interaction Memory
+    "InteractionMemory": "interaction_memory",
+    "Interaction": "interaction_memory",
+    "UserMemory": "interaction_memory",
+    "InteractionType": "interaction_memory",
+    "Sentiment": "interaction_memory",
+    "get_interaction_memory": "interaction_memory",
+    # Content Learning
+    "ContentLearner": "content_learning",
+    "ContentPerformance": "content_learning",
+    "ContentInsight": "content_learning",
+    "ContentType": "content_learning",
+    "TimeSlot": "content_learning",
+    "get_content_learner": "content_learning",
+    # Personality Evolution
+    "PersonalityEvolution": "personality_evolution",
+    "Milestone": "personality_evolution",
+    "MilestoneType": "personality_evolution",
+    "PersonalityTrait": "personality_evolution",
+    "LearningMoment": "personality_evolution",
+    "GrowthArea": "personality_evolution",
+    "get_personality_evolution": "personality_evolution",
+    # Post Memory
+    "PostMemory": "post_memory",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import a public name's submodule on first access (PEP 562)."""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
 
-from .content_learning import (
-    ContentLearner,
-    ContentPerformance,
-    ContentInsight,
-    ContentType,
-    TimeSlot,
-    get_content_learner,
-)
 
-from .personality_evolution import (
-    PersonalityEvolution,
-    Milestone,
-    MilestoneType,
-    PersonalityTrait,
-    LearningMoment,
-    GrowthArea,
-    get_personality_evolution,
-)
+def __dir__() -> list:
+    """List lazily importable names alongside loaded ones."""
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
 
-from .post_memory import PostMemory
 
 __all__ = [
     # Interaction Memory
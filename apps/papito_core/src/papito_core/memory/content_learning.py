@@ -7,11 +7,15 @@ This module handles:
 - Optimizing content strategy over time
 """
 
+import heapq
+import itertools
 import logging
+import uuid
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from enum import Enum
-from typing import Any, Dict, List, Optional, Tuple
+from operator import itemgetter
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 import random
 
 logger = logging.getLogger(__name__)
@@ -44,7 +48,26 @@ class TimeSlot(str, Enum):
     LATE_NIGHT = "late_night"  # 11 PM-5 AM
 
 
-@dataclass
+# Human-readable names used in insight text
+_CONTENT_TYPE_TITLES: Dict[ContentType, str] = {
+    ct: ct.value.replace('_', ' ').title() for ct in ContentType
+}
+_TIME_SLOT_NAMES: Dict[TimeSlot, str] = {ts: ts.value.replace('_', ' ') for ts in TimeSlot}
+
+# Time slot for each hour of the day, indexed by hour
+_HOUR_TO_SLOT: Tuple[TimeSlot, ...] = (
+    (TimeSlot.LATE_NIGHT,) * 5
+    + (TimeSlot.EARLY_MORNING,) * 3
+    + (TimeSlot.MORNING,) * 3
+    + (TimeSlot.MIDDAY,) * 3
+    + (TimeSlot.AFTERNOON,) * 3
+    + (TimeSlot.EVENING,) * 3
+    + (TimeSlot.NIGHT,) * 3
+    + (TimeSlot.LATE_NIGHT,)
+)
+
+
+@dataclass(slots=True)
 class ContentPerformance:
     """Tracks performance of a single piece of content."""
     
@@ -98,7 +121,7 @@ class ContentPerformance:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class ContentInsight:
     """An insight derived from content analysis."""
     
@@ -109,6 +132,70 @@ class ContentInsight:
     data_points: int
 
 
+@dataclass(slots=True)
+class ScoreTotals:
+    """Running count and sum of engagement scores for one bucket."""
+    
+    count: int = 0
+    total: float = 0.0
+    
+    def add(self, score: float) -> None:
+        """Fold one score into the totals."""
+        self.count += 1
+        self.total += score
+    
+    @property
+    def mean(self) -> float:
+        """Average score, 0 when empty."""
+        return self.total / self.count if self.count else 0.0
+
+
+# Minimum scores before a hashtag or topic is ranked
+_MIN_DATA_POINTS = 3
+
+
+def _top_means(performance: Dict[str, ScoreTotals], limit: int) -> List[Tuple[str, float]]:
+    """Rank keys with enough data points by mean score, best first."""
+    return heapq.nlargest(
+        limit,
+        (
+            (key, totals.mean)
+            for key, totals in performance.items()
+            if totals.count >= _MIN_DATA_POINTS
+        ),
+        key=itemgetter(1),
+    )
+
+
+def _best_mean(performance: Dict[Any, ScoreTotals], default: Any) -> Tuple[Any, float]:
+    """Find the bucket with the highest mean score in one pass.
+    
+    Returns:
+        Tuple of (best key or default, its mean)
+    """
+    best_key = default
+    best_avg = 0.0
+    
+    for key, totals in performance.items():
+        if totals.count:
+            avg = totals.mean
+            if avg > best_avg:
+                best_avg = avg
+                best_key = key
+    
+    return best_key, best_avg
+
+
+@dataclass(slots=True)
+class BestPerformers:
+    """Best content type, time slot, hashtags and topics at one point in time."""
+    
+    content_type: ContentType
+    time_slot: TimeSlot
+    hashtags: List[Tuple[str, float]]
+    topics: List[Tuple[str, float]]
+
+
 class ContentLearner:
     """Learns from content performance to optimize strategy.
     
@@ -116,27 +203,43 @@ class ContentLearner:
     recommendations for better content.
     """
     
+    # Number of top performers kept
+    BEST_CONTENT_LIMIT = 50
+    
     def __init__(self):
         """Initialize the content learner."""
         # Performance tracking
         self.content_history: List[ContentPerformance] = []
+        self._by_id: Dict[str, ContentPerformance] = {}
         
         # Aggregated learnings
-        self.type_performance: Dict[ContentType, List[float]] = {ct: [] for ct in ContentType}
-        self.timeslot_performance: Dict[TimeSlot, List[float]] = {ts: [] for ts in TimeSlot}
-        self.hashtag_performance: Dict[str, List[float]] = {}
-        self.topic_performance: Dict[str, List[float]] = {}
+        self.type_performance: Dict[ContentType, ScoreTotals] = {ct: ScoreTotals() for ct in ContentType}
+        self.timeslot_performance: Dict[TimeSlot, ScoreTotals] = {ts: ScoreTotals() for ts in TimeSlot}
+        self.hashtag_performance: Dict[str, ScoreTotals] = {}
+        self.topic_performance: Dict[str, ScoreTotals] = {}
         
-        # Best performers
-        self.best_content: List[ContentPerformance] = []
+        # Best performers: min-heap of (score, -sequence, content), so the
+        # weakest and, among equal scores, newest entry is evicted first
+        self._best_heap: List[Tuple[float, int, ContentPerformance]] = []
+        self._best_sequence = itertools.count()
         
         # Stats
         self.total_content_tracked = 0
+        self._total_scored = 0  # Metric updates folded into the aggregates
+        
+        # Insights and recommendations from the current aggregates;
+        # cleared when metrics change
+        self._insights: Optional[List[ContentInsight]] = None
+        self._recommendations: Optional[Dict[str, Any]] = None
         
+    @property
+    def best_content(self) -> List[ContentPerformance]:
+        """Top performers, highest engagement score first."""
+        return [content for _, _, content in sorted(self._best_heap, reverse=True)]
+    
     def _generate_id(self) -> str:
         """Generate a unique content ID."""
-        import uuid
-        return f"CNT-{str(uuid.uuid4())[:12]}"
+        return f"CNT-{uuid.uuid4().hex[:12]}"
     
     def _get_time_slot(self, time: datetime) -> TimeSlot:
         """Determine time slot from datetime.
@@ -147,22 +250,7 @@ class ContentLearner:
         Returns:
             Appropriate TimeSlot
         """
-        hour = time.hour
-        
-        if 5 <= hour < 8:
-            return TimeSlot.EARLY_MORNING
-        elif 8 <= hour < 11:
-            return TimeSlot.MORNING
-        elif 11 <= hour < 14:
-            return TimeSlot.MIDDAY
-        elif 14 <= hour < 17:
-            return TimeSlot.AFTERNOON
-        elif 17 <= hour < 20:
-            return TimeSlot.EVENING
-        elif 20 <= hour < 23:
-            return TimeSlot.NIGHT
-        else:
-            return TimeSlot.LATE_NIGHT
+        return _HOUR_TO_SLOT[time.hour]
     
     def record_content(
         self,
@@ -184,7 +272,10 @@ class ContentLearner:
         Returns:
             Created ContentPerformance
         """
-        ctype = ContentType(content_type) if content_type in [e.value for e in ContentType] else ContentType.ENGAGEMENT
+        try:
+            ctype = ContentType(content_type)
+        except ValueError:
+            ctype = ContentType.ENGAGEMENT
         
         performance = ContentPerformance(
             id=self._generate_id(),
@@ -197,9 +288,10 @@ class ContentLearner:
         )
         
         self.content_history.append(performance)
+        self._by_id[performance.id] = performance
         self.total_content_tracked += 1
         
-        logger.info(f"Recorded content: {performance.id} ({ctype.value})")
+        logger.debug("Recorded content: %s (%s)", performance.id, ctype.value)
         return performance
     
     def update_metrics(
@@ -224,7 +316,7 @@ class ContentLearner:
         Returns:
             Updated ContentPerformance or None
         """
-        content = next((c for c in self.content_history if c.id == content_id), None)
+        content = self._by_id.get(content_id)
         
         if not content:
             return None
@@ -238,54 +330,82 @@ class ContentLearner:
         
         # Update aggregated data
         score = content.engagement_score
+        self._total_scored += 1
         
         # Type performance
-        self.type_performance[content.content_type].append(score)
+        self.type_performance[content.content_type].add(score)
         
         # Time slot performance
-        self.timeslot_performance[content.time_slot].append(score)
+        self.timeslot_performance[content.time_slot].add(score)
         
         # Hashtag performance
         for hashtag in content.hashtags:
-            if hashtag not in self.hashtag_performance:
-                self.hashtag_performance[hashtag] = []
-            self.hashtag_performance[hashtag].append(score)
+            totals = self.hashtag_performance.get(hashtag)
+            if totals is None:
+                totals = self.hashtag_performance[hashtag] = ScoreTotals()
+            totals.add(score)
         
         # Topic performance
         for topic in content.topics:
-            if topic not in self.topic_performance:
-                self.topic_performance[topic] = []
-            self.topic_performance[topic].append(score)
+            totals = self.topic_performance.get(topic)
+            if totals is None:
+                totals = self.topic_performance[topic] = ScoreTotals()
+            totals.add(score)
+        
+        self._insights = None
+        self._recommendations = None
         
         # Track best performers
         if score > 0:
-            self.best_content.append(content)
-            self.best_content = sorted(
-                self.best_content,
-                key=lambda x: x.engagement_score,
-                reverse=True
-            )[:50]  # Keep top 50
-        
-        logger.info(f"Updated metrics for {content_id}: score={score}")
+            entry = (score, -next(self._best_sequence), content)
+            if len(self._best_heap) < self.BEST_CONTENT_LIMIT:
+                heapq.heappush(self._best_heap, entry)
+            else:
+                heapq.heappushpop(self._best_heap, entry)
+        
+        logger.debug("Updated metrics for %s: score=%s", content_id, score)
         return content
     
+    def record_content_batch(self, rows: Iterable[Dict[str, Any]]) -> List[ContentPerformance]:
+        """Record many pieces of content, e.g. for an analytics backfill.
+        
+        Args:
+            rows: record_content keyword arguments, one dict per post
+            
+        Returns:
+            Created ContentPerformance objects, in row order
+        """
+        recorded = [self.record_content(**row) for row in rows]
+        logger.info("Recorded %d content items", len(recorded))
+        return recorded
+    
+    def update_metrics_batch(
+        self, updates: Iterable[Dict[str, Any]]
+    ) -> List[Optional[ContentPerformance]]:
+        """Update metrics for many pieces of content.
+        
+        Args:
+            updates: update_metrics keyword arguments (content_id plus
+                metrics), one dict per post
+                
+        Returns:
+            Updated ContentPerformance or None for each update, in order
+        """
+        updated = [self.update_metrics(**update) for update in updates]
+        logger.info(
+            "Updated metrics for %d of %d content items",
+            sum(content is not None for content in updated),
+            len(updated),
+        )
+        return updated
+    
     def get_best_content_type(self) -> Tuple[ContentType, float]:
         """Get the best performing content type.
         
         Returns:
             Tuple of (ContentType, average_score)
         """
-        best_type = ContentType.ENGAGEMENT
-        best_avg = 0.0
-        
-        for ctype, scores in self.type_performance.items():
-            if scores:
-                avg = sum(scores) / len(scores)
-                if avg > best_avg:
-                    best_avg = avg
-                    best_type = ctype
-        
-        return best_type, best_avg
+        return _best_mean(self.type_performance, ContentType.ENGAGEMENT)
     
     def get_best_time_slot(self) -> Tuple[TimeSlot, float]:
         """Get the best performing time slot.
@@ -293,17 +413,7 @@ class ContentLearner:
         Returns:
             Tuple of (TimeSlot, average_score)
         """
-        best_slot = TimeSlot.EVENING
-        best_avg = 0.0
-        
-        for slot, scores in self.timeslot_performance.items():
-            if scores:
-                avg = sum(scores) / len(scores)
-                if avg > best_avg:
-                    best_avg = avg
-                    best_slot = slot
-        
-        return best_slot, best_avg
+        return _best_mean(self.timeslot_performance, TimeSlot.EVENING)
     
     def get_best_hashtags(self, limit: int = 5) -> List[Tuple[str, float]]:
         """Get best performing hashtags.
@@ -314,14 +424,7 @@ class ContentLearner:
         Returns:
             List of (hashtag, average_score) tuples
         """
-        hashtag_avgs = []
-        
-        for hashtag, scores in self.hashtag_performance.items():
-            if len(scores) >= 3:  # Minimum data points
-                avg = sum(scores) / len(scores)
-                hashtag_avgs.append((hashtag, avg))
-        
-        return sorted(hashtag_avgs, key=lambda x: x[1], reverse=True)[:limit]
+        return _top_means(self.hashtag_performance, limit)
     
     def get_best_topics(self, limit: int = 5) -> List[Tuple[str, float]]:
         """Get best performing topics.
@@ -332,14 +435,16 @@ class ContentLearner:
         Returns:
             List of (topic, average_score) tuples
         """
-        topic_avgs = []
-        
-        for topic, scores in self.topic_performance.items():
-            if len(scores) >= 3:
-                avg = sum(scores) / len(scores)
-                topic_avgs.append((topic, avg))
-        
-        return sorted(topic_avgs, key=lambda x: x[1], reverse=True)[:limit]
+        return _top_means(self.topic_performance, limit)
+    
+    def _compute_all_bests(self, limit: int) -> BestPerformers:
+        """Find every best performer with one pass over each aggregate."""
+        return BestPerformers(
+            content_type=_best_mean(self.type_performance, ContentType.ENGAGEMENT)[0],
+            time_slot=_best_mean(self.timeslot_performance, TimeSlot.EVENING)[0],
+            hashtags=self.get_best_hashtags(limit),
+            topics=self.get_best_topics(limit),
+        )
     
     def generate_insights(self) -> List[ContentInsight]:
         """Generate insights from content performance data.
@@ -347,38 +452,44 @@ class ContentLearner:
         Returns:
             List of ContentInsight objects
         """
+        if self._insights is None:
+            self._insights = self._build_insights(self._compute_all_bests(3))
+        return list(self._insights)
+    
+    def _build_insights(self, bests: BestPerformers) -> List[ContentInsight]:
+        """Derive insights from the best performers."""
         insights = []
         
         # Content type insight
-        if sum(len(s) for s in self.type_performance.values()) >= 10:
-            best_type, best_score = self.get_best_content_type()
+        if self._total_scored >= 10:
+            best_type = bests.content_type
             
-            type_data = len(self.type_performance[best_type])
+            type_data = self.type_performance[best_type].count
             if type_data >= 3:
                 insights.append(ContentInsight(
                     category="content_type",
-                    insight=f"{best_type.value.replace('_', ' ').title()} content performs best",
+                    insight=f"{_CONTENT_TYPE_TITLES[best_type]} content performs best",
                     confidence=min(type_data / 20, 1.0),
                     recommendation=f"Consider posting more {best_type.value} content",
                     data_points=type_data,
                 ))
         
         # Time slot insight
-        if sum(len(s) for s in self.timeslot_performance.values()) >= 10:
-            best_slot, best_score = self.get_best_time_slot()
+        if self._total_scored >= 10:
+            best_slot = bests.time_slot
             
-            slot_data = len(self.timeslot_performance[best_slot])
+            slot_data = self.timeslot_performance[best_slot].count
             if slot_data >= 3:
                 insights.append(ContentInsight(
                     category="timing",
-                    insight=f"Best engagement during {best_slot.value.replace('_', ' ')}",
+                    insight=f"Best engagement during {_TIME_SLOT_NAMES[best_slot]}",
                     confidence=min(slot_data / 20, 1.0),
-                    recommendation=f"Prioritize posting during {best_slot.value.replace('_', ' ')}",
+                    recommendation=f"Prioritize posting during {_TIME_SLOT_NAMES[best_slot]}",
                     data_points=slot_data,
                 ))
         
         # Hashtag insight
-        best_hashtags = self.get_best_hashtags(3)
+        best_hashtags = bests.hashtags[:3]
         if best_hashtags:
             hashtag_str = ", ".join(h[0] for h in best_hashtags)
             insights.append(ContentInsight(
@@ -386,11 +497,11 @@ class ContentLearner:
                 insight=f"Top performing hashtags: {hashtag_str}",
                 confidence=0.7,
                 recommendation=f"Use hashtags like {best_hashtags[0][0]} more often",
-                data_points=sum(len(self.hashtag_performance.get(h[0], [])) for h in best_hashtags),
+                data_points=sum(self.hashtag_performance[h[0]].count for h in best_hashtags),
             ))
         
         # Topic insight
-        best_topics = self.get_best_topics(3)
+        best_topics = bests.topics[:3]
         if best_topics:
             topic_str = ", ".join(t[0] for t in best_topics)
             insights.append(ContentInsight(
@@ -398,7 +509,7 @@ class ContentLearner:
                 insight=f"Audience engages most with: {topic_str}",
                 confidence=0.7,
                 recommendation=f"Focus content on {best_topics[0][0]}",
-                data_points=sum(len(self.topic_performance.get(t[0], [])) for t in best_topics),
+                data_points=sum(self.topic_performance[t[0]].count for t in best_topics),
             ))
         
         return insights
@@ -406,9 +517,20 @@ class ContentLearner:
     def get_content_recommendations(self) -> Dict[str, Any]:
         """Get recommendations for next content.
         
+        The result is cached until metrics change; treat it as read-only.
+        
         Returns:
             Dictionary of recommendations
         """
+        if self._recommendations is not None:
+            return self._recommendations
+        
+        bests = self._compute_all_bests(5)
+        
+        # Top 5 ranks extend the top 3 the insights use, so reuse them
+        if self._insights is None:
+            self._insights = self._build_insights(bests)
+        
         recommendations = {
             "recommended_type": None,
             "recommended_time": None,
@@ -418,20 +540,18 @@ class ContentLearner:
         }
         
         # Best type
-        if any(self.type_performance.values()):
-            best_type, _ = self.get_best_content_type()
-            recommendations["recommended_type"] = best_type.value
+        if self._total_scored:
+            recommendations["recommended_type"] = bests.content_type.value
         
         # Best time
-        if any(self.timeslot_performance.values()):
-            best_slot, _ = self.get_best_time_slot()
-            recommendations["recommended_time"] = best_slot.value
+        if self._total_scored:
+            recommendations["recommended_time"] = bests.time_slot.value
         
         # Best hashtags
-        recommendations["recommended_hashtags"] = [h[0] for h in self.get_best_hashtags(5)]
+        recommendations["recommended_hashtags"] = [h[0] for h in bests.hashtags]
         
         # Best topics
-        recommendations["recommended_topics"] = [t[0] for t in self.get_best_topics(5)]
+        recommendations["recommended_topics"] = [t[0] for t in bests.topics]
         
         # Insights
         recommendations["insights"] = [
@@ -441,16 +561,17 @@ class ContentLearner:
                 "recommendation": i.recommendation,
                 "confidence": i.confidence,
             }
-            for i in self.generate_insights()
+            for i in self._insights
         ]
         
+        self._recommendations = recommendations
         return recommendations
     
     def get_stats(self) -> Dict[str, Any]:
         """Get content learning statistics."""
         return {
             "total_content_tracked": self.total_content_tracked,
-            "best_performers_count": len(self.best_content),
+            "best_performers_count": len(self._best_heap),
             "hashtags_tracked": len(self.hashtag_performance),
             "topics_tracked": len(self.topic_performance),
             "insights_available": len(self.generate_insights()),
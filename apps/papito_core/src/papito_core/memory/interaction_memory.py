@@ -7,15 +7,64 @@ This module handles:
 - Providing context for future interactions
 """
 
+import heapq
 import logging
+import re
+import sys
+import uuid
+from bisect import bisect_left, bisect_right, insort
+from collections import Counter, deque
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from enum import Enum
-from typing import Any, Dict, List, Optional
-import json
+from itertools import count, islice
+from typing import Any, Deque, Dict, Iterable, List, Optional, Set, Tuple
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
 
 logger = logging.getLogger(__name__)
 
+# Interactions kept per user unless InteractionMemory is given another bound
+DEFAULT_MAX_INTERACTIONS_PER_USER = 100
+
+# Sentiment words, matched as substrings of the lowercased content
+POSITIVE_WORDS = (
+    "love", "amazing", "great", "awesome", "fire", "🔥", "❤️",
+    "beautiful", "blessed", "thank", "appreciate", "incredible",
+    "best", "favorite", "goat", "legend", "inspired",
+)
+NEGATIVE_WORDS = (
+    "hate", "trash", "terrible", "worst", "bad", "sucks",
+    "boring", "disappointed", "fake", "fraud",
+)
+
+
+def _word_scanner(words: tuple) -> re.Pattern:
+    """Compile a pattern matching any of the words at every position.
+    
+    The lookahead lets matches overlap, so each word is found wherever it
+    occurs as a substring, as with a plain ``in`` check.
+    """
+    return re.compile("(?=(" + "|".join(map(re.escape, words)) + "))")
+
+
+_POSITIVE_RE = _word_scanner(POSITIVE_WORDS)
+_NEGATIVE_RE = _word_scanner(NEGATIVE_WORDS)
+
+# Fixed personalization prompt fragments
+_NEW_USER_PROMPT = "This is a new user you haven't interacted with before. Be welcoming!"
+_RETURNING_PROMPT = "This is a returning supporter."
+_FEW_TIMES_PROMPT = "This user has interacted a few times before."
+_SENTIMENT_PROMPTS = {
+    "very_positive": "They're very positive about your music!",
+    "positive": "They've been supportive in past interactions.",
+}
+_NOTABLE_PROMPT = "This is a notable account - give extra attention!"
+_COLLABORATOR_PROMPT = "This is a potential collaborator."
+
 
 class InteractionType(str, Enum):
     """Types of interactions Papito has."""
@@ -40,7 +89,7 @@ class Sentiment(str, Enum):
     NEGATIVE = "negative"
 
 
-@dataclass
+@dataclass(slots=True)
 class Interaction:
     """Represents a single interaction with a user."""
     
@@ -57,7 +106,7 @@ class Interaction:
     metadata: Dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class UserMemory:
     """Memory of interactions with a specific user."""
     
@@ -67,23 +116,44 @@ class UserMemory:
     first_interaction: datetime
     last_interaction: datetime
     interaction_count: int = 0
-    interactions: List[Interaction] = field(default_factory=list)
-    topics_discussed: Dict[str, int] = field(default_factory=dict)  # topic -> count
+    interactions: Deque[Interaction] = field(
+        default_factory=lambda: deque(maxlen=DEFAULT_MAX_INTERACTIONS_PER_USER)
+    )
+    topics_discussed: Counter[str] = field(default_factory=Counter)  # topic -> count
     sentiment_history: List[Sentiment] = field(default_factory=list)
     is_fan: bool = False
     is_notable: bool = False
     is_collaborator: bool = False
     notes: str = ""
     tags: List[str] = field(default_factory=list)
+    positive_count: int = 0
+    negative_count: int = 0
+    _top_topics: Optional[List[str]] = field(default=None, init=False, repr=False, compare=False)
+    
+    def __post_init__(self) -> None:
+        """Bound interaction histories passed in without a length limit."""
+        if not isinstance(self.interactions, deque) or self.interactions.maxlen is None:
+            self.interactions = deque(self.interactions, maxlen=DEFAULT_MAX_INTERACTIONS_PER_USER)
+    
+    def add_topics(self, topics: List[str]) -> None:
+        """Count topics discussed in an interaction."""
+        if topics:
+            self.topics_discussed.update(topics)
+            self._top_topics = None
+    
+    def add_sentiment(self, sentiment: Sentiment) -> None:
+        """Record an interaction's sentiment and update the running counts."""
+        self.sentiment_history.append(sentiment)
+        if sentiment == Sentiment.POSITIVE:
+            self.positive_count += 1
+        elif sentiment == Sentiment.NEGATIVE:
+            self.negative_count += 1
     
     @property
     def average_sentiment(self) -> str:
-        """Calculate average sentiment from history."""
-        if not self.sentiment_history:
-            return "neutral"
-        
-        positive = sum(1 for s in self.sentiment_history if s == Sentiment.POSITIVE)
-        negative = sum(1 for s in self.sentiment_history if s == Sentiment.NEGATIVE)
+        """Calculate average sentiment from the running counts."""
+        positive = self.positive_count
+        negative = self.negative_count
         
         if positive > negative * 2:
             return "very_positive"
@@ -115,13 +185,47 @@ class UserMemory:
     
     @property
     def top_topics(self) -> List[str]:
-        """Get top discussed topics."""
-        sorted_topics = sorted(
-            self.topics_discussed.items(),
-            key=lambda x: x[1],
-            reverse=True
-        )
-        return [t[0] for t in sorted_topics[:5]]
+        """Get top discussed topics, cached until new topics are added."""
+        if self._top_topics is None:
+            self._top_topics = [topic for topic, _ in self.topics_discussed.most_common(5)]
+        return list(self._top_topics)
+
+
+def _build_keyword_table(topic_keywords: Dict[str, List[str]]) -> tuple:
+    """Flatten the topic table into (keyword, topic indices) pairs.
+    
+    Args:
+        topic_keywords: Topic -> keywords table
+        
+    Returns:
+        One pair per distinct keyword, with the indices of every topic
+        listing it
+    """
+    keyword_topics: Dict[str, List[int]] = {}
+    for index, keywords in enumerate(topic_keywords.values()):
+        for keyword in keywords:
+            keyword_topics.setdefault(keyword, []).append(index)
+    return tuple((keyword, tuple(indices)) for keyword, indices in keyword_topics.items())
+
+
+def _build_topic_automaton(keyword_table: tuple) -> Optional[Any]:
+    """Build an Aho-Corasick automaton mapping keywords to topic indices.
+    
+    Args:
+        keyword_table: (keyword, topic indices) pairs
+        
+    Returns:
+        Automaton whose values are (keyword, topic indices), or None when
+        pyahocorasick is not installed
+    """
+    if ahocorasick is None:
+        return None
+    
+    automaton = ahocorasick.Automaton()
+    for keyword, indices in keyword_table:
+        automaton.add_word(keyword, (keyword, indices))
+    automaton.make_automaton()
+    return automaton
 
 
 class InteractionMemory:
@@ -142,8 +246,14 @@ class InteractionMemory:
         "support": ["support", "fan", "love", "appreciate", "thank"],
         "creative": ["create", "inspire", "art", "creative", "vision"],
     }
+    _TOPICS = tuple(TOPIC_KEYWORDS)
+    _KEYWORD_TABLE = _build_keyword_table(TOPIC_KEYWORDS)
+    _TOPIC_AUTOMATON = _build_topic_automaton(_KEYWORD_TABLE)
+    
+    # Interactions kept in the cross-user recent log
+    MAX_RECENT_INTERACTIONS = 1000
     
-    def __init__(self, max_interactions_per_user: int = 100):
+    def __init__(self, max_interactions_per_user: int = DEFAULT_MAX_INTERACTIONS_PER_USER):
         """Initialize the interaction memory.
         
         Args:
@@ -153,54 +263,63 @@ class InteractionMemory:
         
         # Memory storage
         self.users: Dict[str, UserMemory] = {}  # user_id -> UserMemory
-        self.recent_interactions: List[Interaction] = []
+        self.recent_interactions: Deque[Interaction] = deque(maxlen=self.MAX_RECENT_INTERACTIONS)
+        
+        # Flag indexes, kept in step with the UserMemory flags
+        self._fans: Dict[str, UserMemory] = {}  # user_id -> UserMemory, in marking order
+        self._notable: Set[str] = set()  # user_ids
+        self._collaborators: Set[str] = set()  # user_ids
+        
+        # Recency index: (last_interaction, user_id) kept sorted, plus each user's current key
+        self._recency: List[Tuple[datetime, str]] = []
+        self._recency_keys: Dict[str, Tuple[datetime, str]] = {}  # user_id -> key
         
         # Stats
         self.total_interactions = 0
         self.unique_users = 0
         
+        # IDs are a random per-instance prefix plus a running counter
+        self._id_prefix = f"INT-{uuid.uuid4().hex[:8]}-"
+        self._id_counter = count(1)
+        
     def _generate_id(self) -> str:
         """Generate a unique interaction ID."""
-        import uuid
-        return f"INT-{str(uuid.uuid4())[:12]}"
+        return f"{self._id_prefix}{next(self._id_counter):x}"
     
-    def _extract_topics(self, content: str) -> List[str]:
+    def _extract_topics(self, content_lower: str) -> List[str]:
         """Extract topics from content.
         
         Args:
-            content: Text content to analyze
+            content_lower: Lowercased text content to analyze
             
         Returns:
             List of identified topics
         """
-        content_lower = content.lower()
-        topics = []
-        
-        for topic, keywords in self.TOPIC_KEYWORDS.items():
-            if any(kw in content_lower for kw in keywords):
-                topics.append(topic)
+        matched = set()
+        if self._TOPIC_AUTOMATON is not None:
+            # One pass over the content finds every keyword occurrence
+            for _, (_, topic_indices) in self._TOPIC_AUTOMATON.iter(content_lower):
+                matched.update(topic_indices)
+        else:
+            # Each distinct keyword is checked once, shared keywords included
+            for keyword, topic_indices in self._KEYWORD_TABLE:
+                if keyword in content_lower:
+                    matched.update(topic_indices)
         
-        return topics
+        return [self._TOPICS[index] for index in sorted(matched)]
     
-    def _analyze_sentiment(self, content: str) -> Sentiment:
+    def _analyze_sentiment(self, content_lower: str) -> Sentiment:
         """Simple sentiment analysis.
         
         Args:
-            content: Text to analyze
+            content_lower: Lowercased text to analyze
             
         Returns:
             Detected sentiment
         """
-        content_lower = content.lower()
-        
-        positive_words = ["love", "amazing", "great", "awesome", "fire", "🔥", "❤️", 
-                         "beautiful", "blessed", "thank", "appreciate", "incredible",
-                         "best", "favorite", "goat", "legend", "inspired"]
-        negative_words = ["hate", "trash", "terrible", "worst", "bad", "sucks",
-                         "boring", "disappointed", "fake", "fraud"]
-        
-        positive_count = sum(1 for w in positive_words if w in content_lower)
-        negative_count = sum(1 for w in negative_words if w in content_lower)
+        # Each distinct word counts once, however often it appears
+        positive_count = len(set(_POSITIVE_RE.findall(content_lower)))
+        negative_count = len(set(_NEGATIVE_RE.findall(content_lower)))
         
         if positive_count > negative_count:
             return Sentiment.POSITIVE
@@ -236,65 +355,102 @@ class InteractionMemory:
         Returns:
             Created Interaction
         """
+        now = datetime.utcnow()
+        # Every interaction from a user shares one copy of their names
+        username = sys.intern(username)
+        display_name = sys.intern(display_name)
+        
+        users = self.users
+        
         # Get or create user memory
-        if user_id not in self.users:
-            self.users[user_id] = UserMemory(
+        user_memory = users.get(user_id)
+        if user_memory is None:
+            user_memory = users[user_id] = UserMemory(
                 user_id=user_id,
                 username=username,
                 display_name=display_name,
-                first_interaction=datetime.utcnow(),
-                last_interaction=datetime.utcnow(),
+                first_interaction=now,
+                last_interaction=now,
+                interactions=deque(maxlen=self.max_interactions_per_user),
             )
             self.unique_users += 1
         
-        user_memory = self.users[user_id]
+        try:
+            itype = InteractionType(interaction_type)
+        except ValueError:
+            itype = InteractionType.MENTION
         
         # Analyze content
-        topics = self._extract_topics(content)
-        sentiment = self._analyze_sentiment(content)
+        content_lower = content.lower()
+        topics = self._extract_topics(content_lower)
+        sentiment = self._analyze_sentiment(content_lower)
         
         # Create interaction
         interaction = Interaction(
             id=self._generate_id(),
             user_id=user_id,
             username=username,
-            interaction_type=InteractionType(interaction_type) if interaction_type in [e.value for e in InteractionType] else InteractionType.MENTION,
+            interaction_type=itype,
             content=content,
             sentiment=sentiment,
             topics=topics,
             responded=responded,
             response=response,
+            timestamp=now,
             metadata=metadata or {},
         )
         
         # Update user memory
-        user_memory.last_interaction = datetime.utcnow()
+        self._touch(user_memory, now)
         user_memory.interaction_count += 1
         user_memory.interactions.append(interaction)
-        user_memory.sentiment_history.append(sentiment)
+        user_memory.add_sentiment(sentiment)
         
         # Update topics discussed
-        for topic in topics:
-            user_memory.topics_discussed[topic] = user_memory.topics_discussed.get(topic, 0) + 1
+        user_memory.add_topics(topics)
         
         # Flag as notable if specified
         if is_notable:
             user_memory.is_notable = True
+            self._notable.add(user_id)
         
-        # Trim old interactions if needed
-        if len(user_memory.interactions) > self.max_interactions_per_user:
-            user_memory.interactions = user_memory.interactions[-self.max_interactions_per_user:]
-        
-        # Add to recent interactions
+        # Add to recent interactions (the bounded deque drops the oldest)
         self.recent_interactions.append(interaction)
-        if len(self.recent_interactions) > 1000:
-            self.recent_interactions = self.recent_interactions[-500:]
         
         self.total_interactions += 1
         
-        logger.info(f"Recorded interaction from @{username}: {interaction_type}")
+        logger.debug("Recorded interaction from @%s: %s", username, itype.value)
         return interaction
     
+    def _touch(self, user_memory: UserMemory, when: datetime) -> None:
+        """Set a user's last interaction time, keeping the recency index in step."""
+        user_id = user_memory.user_id
+        recency = self._recency
+        old_key = self._recency_keys.get(user_id)
+        if old_key is not None:
+            del recency[bisect_left(recency, old_key)]
+        key = (when, user_id)
+        # Interactions arrive in time order, so the new key usually goes at the end
+        if not recency or key > recency[-1]:
+            recency.append(key)
+        else:
+            insort(recency, key)
+        self._recency_keys[user_id] = key
+        user_memory.last_interaction = when
+    
+    def record_interactions_batch(self, rows: Iterable[Dict[str, Any]]) -> List[Interaction]:
+        """Record many interactions, e.g. when importing past mentions or DMs.
+        
+        Args:
+            rows: record_interaction keyword arguments, one dict per interaction
+            
+        Returns:
+            Created Interaction objects, in row order
+        """
+        recorded = [self.record_interaction(**row) for row in rows]
+        logger.info("Recorded %d interactions", len(recorded))
+        return recorded
+    
     def get_user_context(self, user_id: str) -> Optional[Dict[str, Any]]:
         """Get context about a user for personalized responses.
         
@@ -304,13 +460,12 @@ class InteractionMemory:
         Returns:
             Context dictionary or None if user not found
         """
-        if user_id not in self.users:
+        user = self.users.get(user_id)
+        if user is None:
             return None
         
-        user = self.users[user_id]
-        
         # Get recent interactions summary
-        recent = user.interactions[-5:] if user.interactions else []
+        recent = list(islice(reversed(user.interactions), 5))[::-1]
         recent_summary = [
             {
                 "type": i.interaction_type.value,
@@ -348,40 +503,41 @@ class InteractionMemory:
         Returns:
             Personalization text for AI prompt
         """
-        context = self.get_user_context(user_id)
+        user = self.users.get(user_id)
         
-        if not context:
-            return "This is a new user you haven't interacted with before. Be welcoming!"
+        if user is None:
+            return _NEW_USER_PROMPT
         
         prompt_parts = []
         
         # Relationship status
-        if context["interaction_count"] > 10:
-            prompt_parts.append(f"This is a loyal supporter who has interacted {context['interaction_count']} times.")
-        elif context["interaction_count"] > 3:
-            prompt_parts.append("This is a returning supporter.")
+        interaction_count = user.interaction_count
+        if interaction_count > 10:
+            prompt_parts.append(f"This is a loyal supporter who has interacted {interaction_count} times.")
+        elif interaction_count > 3:
+            prompt_parts.append(_RETURNING_PROMPT)
         else:
-            prompt_parts.append("This user has interacted a few times before.")
+            prompt_parts.append(_FEW_TIMES_PROMPT)
         
         # Sentiment
-        if context["average_sentiment"] == "very_positive":
-            prompt_parts.append("They're very positive about your music!")
-        elif context["average_sentiment"] == "positive":
-            prompt_parts.append("They've been supportive in past interactions.")
+        sentiment_prompt = _SENTIMENT_PROMPTS.get(user.average_sentiment)
+        if sentiment_prompt:
+            prompt_parts.append(sentiment_prompt)
         
         # Topics
-        if context["top_topics"]:
-            prompt_parts.append(f"You've discussed: {', '.join(context['top_topics'][:3])}.")
+        top_topics = user.top_topics
+        if top_topics:
+            prompt_parts.append(f"You've discussed: {', '.join(top_topics[:3])}.")
         
         # Notable status
-        if context["is_notable"]:
-            prompt_parts.append("This is a notable account - give extra attention!")
-        if context["is_collaborator"]:
-            prompt_parts.append("This is a potential collaborator.")
+        if user.is_notable:
+            prompt_parts.append(_NOTABLE_PROMPT)
+        if user.is_collaborator:
+            prompt_parts.append(_COLLABORATOR_PROMPT)
         
         # Notes
-        if context["notes"]:
-            prompt_parts.append(f"Notes: {context['notes']}")
+        if user.notes:
+            prompt_parts.append(f"Notes: {user.notes}")
         
         return " ".join(prompt_parts)
     
@@ -394,10 +550,12 @@ class InteractionMemory:
         Returns:
             Success status
         """
-        if user_id in self.users:
-            self.users[user_id].is_fan = True
-            return True
-        return False
+        user = self.users.get(user_id)
+        if user is None:
+            return False
+        user.is_fan = True
+        self._fans[user_id] = user
+        return True
     
     def mark_as_collaborator(self, user_id: str) -> bool:
         """Mark a user as a potential collaborator.
@@ -408,10 +566,12 @@ class InteractionMemory:
         Returns:
             Success status
         """
-        if user_id in self.users:
-            self.users[user_id].is_collaborator = True
-            return True
-        return False
+        user = self.users.get(user_id)
+        if user is None:
+            return False
+        user.is_collaborator = True
+        self._collaborators.add(user_id)
+        return True
     
     def add_note(self, user_id: str, note: str) -> bool:
         """Add a note about a user.
@@ -423,10 +583,11 @@ class InteractionMemory:
         Returns:
             Success status
         """
-        if user_id in self.users:
-            self.users[user_id].notes = note
-            return True
-        return False
+        user = self.users.get(user_id)
+        if user is None:
+            return False
+        user.notes = note
+        return True
     
     def add_tag(self, user_id: str, tag: str) -> bool:
         """Add a tag to a user.
@@ -438,11 +599,12 @@ class InteractionMemory:
         Returns:
             Success status
         """
-        if user_id in self.users:
-            if tag not in self.users[user_id].tags:
-                self.users[user_id].tags.append(tag)
-            return True
-        return False
+        user = self.users.get(user_id)
+        if user is None:
+            return False
+        if tag not in user.tags:
+            user.tags.append(tag)
+        return True
     
     def get_fans(self, limit: int = 20) -> List[UserMemory]:
         """Get users marked as fans.
@@ -453,8 +615,7 @@ class InteractionMemory:
         Returns:
             List of fan UserMemory objects
         """
-        fans = [u for u in self.users.values() if u.is_fan]
-        return sorted(fans, key=lambda x: x.relationship_strength, reverse=True)[:limit]
+        return heapq.nlargest(limit, self._fans.values(), key=lambda x: x.relationship_strength)
     
     def get_recent_users(self, hours: int = 24, limit: int = 50) -> List[UserMemory]:
         """Get users who interacted recently.
@@ -467,17 +628,20 @@ class InteractionMemory:
             List of recent UserMemory objects
         """
         cutoff = datetime.utcnow() - timedelta(hours=hours)
-        recent = [u for u in self.users.values() if u.last_interaction > cutoff]
-        return sorted(recent, key=lambda x: x.last_interaction, reverse=True)[:limit]
+        recency = self._recency
+        # Index entries after the cutoff are recent; take the newest `limit` of them
+        start = max(bisect_right(recency, cutoff, key=lambda k: k[0]), len(recency) - limit)
+        users = self.users
+        return [users[user_id] for _, user_id in reversed(recency[start:])]
     
     def get_stats(self) -> Dict[str, Any]:
         """Get memory system statistics."""
         return {
             "total_interactions": self.total_interactions,
             "unique_users": self.unique_users,
-            "fans_count": len([u for u in self.users.values() if u.is_fan]),
-            "notable_count": len([u for u in self.users.values() if u.is_notable]),
-            "collaborators_count": len([u for u in self.users.values() if u.is_collaborator]),
+            "fans_count": len(self._fans),
+            "notable_count": len(self._notable),
+            "collaborators_count": len(self._collaborators),
             "recent_interactions": len(self.recent_interactions),
         }
 
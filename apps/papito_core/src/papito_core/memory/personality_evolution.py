@@ -179,7 +179,10 @@ class PersonalityEvolution:
         Returns:
             Created Milestone
         """
-        mtype = MilestoneType(milestone_type) if milestone_type in [e.value for e in MilestoneType] else MilestoneType.PERSONAL
+        try:
+            mtype = MilestoneType(milestone_type)
+        except ValueError:
+            mtype = MilestoneType.PERSONAL
         
         milestone = Milestone(
             id=self._generate_id("M"),
@@ -215,7 +218,11 @@ class PersonalityEvolution:
         Returns:
             Created LearningMoment
         """
-        area = GrowthArea(growth_area) if growth_area in [e.value for e in GrowthArea] else GrowthArea.PERSONAL
+        # GrowthArea has no catch-all member; unknown areas count as artistic voice
+        try:
+            area = GrowthArea(growth_area)
+        except ValueError:
+            area = GrowthArea.ARTISTIC_VOICE
         
         learning = LearningMoment(
             id=self._generate_id("L"),
@@ -2,7 +2,7 @@
 
 Goal:
 - Reduce generic/repeated posts by tracking recent content fingerprints.
-- Keep it lightweight (JSON file), safe for Railway runtime.
+- Keep it lightweight (append-only JSON Lines file), safe for Railway runtime.
 
 This is NOT a full analytics system; it's a simple guardrail.
 """
@@ -19,23 +19,38 @@ from typing import Any, Dict, List, Optional
 
 
 _WORD_RE = re.compile(r"[a-z0-9']+")
+_SPACE_RE = re.compile(r"\s+")
 
 
 def _normalize(text: str) -> str:
     text = (text or "").strip().lower()
-    text = re.sub(r"\s+", " ", text)
+    text = _SPACE_RE.sub(" ", text)
     return text
 
 
-def _tokens(text: str) -> set[str]:
-    return set(_WORD_RE.findall(_normalize(text)))
+def _hash(canonical: str) -> str:
+    # An equality key only, so a fast 128-bit digest is plenty.
+    return hashlib.blake2b(canonical.encode("utf-8", errors="ignore"), digest_size=16).hexdigest()
 
 
-def _fingerprint(text: str) -> str:
-    canonical = _normalize(text)
+# Items recorded before the switch to BLAKE2b carry 64-hex SHA-256 fingerprints.
+_LEGACY_FINGERPRINT_LEN = 64
+
+
+def _legacy_hash(canonical: str) -> str:
     return hashlib.sha256(canonical.encode("utf-8", errors="ignore")).hexdigest()
 
 
+def _analyze(text: str) -> tuple[str, set[str]]:
+    """Normalize once and return the canonical text and word tokens."""
+    canonical = _normalize(text)
+    return canonical, set(_WORD_RE.findall(canonical))
+
+
+def _tokens(text: str) -> set[str]:
+    return set(_WORD_RE.findall(_normalize(text)))
+
+
 def _jaccard(a: set[str], b: set[str]) -> float:
     if not a or not b:
         return 0.0
@@ -50,91 +65,172 @@ class MemoryItem:
     created_at: str
     kind: str
     preview: str
-    token_sample: List[str]
+    token_sample: frozenset[str]
+
+
+def _item_from_dict(it: Any) -> Optional[MemoryItem]:
+    if not isinstance(it, dict):
+        return None
+    fp = it.get("fingerprint")
+    if not fp:
+        return None
+    return MemoryItem(
+        fingerprint=fp,
+        created_at=str(it.get("created_at") or ""),
+        kind=str(it.get("kind") or "unknown"),
+        preview=str(it.get("preview") or ""),
+        token_sample=frozenset(it.get("token_sample") or []),
+    )
+
+
+def _item_to_line(item: MemoryItem) -> str:
+    return json.dumps(
+        {
+            "fingerprint": item.fingerprint,
+            "created_at": item.created_at,
+            "kind": item.kind,
+            "preview": item.preview,
+            "token_sample": sorted(item.token_sample),
+        }
+    ) + "\n"
 
 
 class PostMemory:
-    """Stores a rolling window of recent posts to prevent repeats."""
+    """Stores a rolling window of recent posts to prevent repeats.
+
+    Posts are appended to a JSON Lines file, one item per line. The file is
+    rewritten with just the current window once it holds twice as many lines.
+    """
+
+    _LEGACY_FILE = os.path.join("data", "post_memory.json")
 
     def __init__(self, file_path: Optional[str] = None, max_items: int = 200):
-        self.file_path = file_path or os.getenv("PAPITO_POST_MEMORY_FILE") or os.path.join(
-            "data", "post_memory.json"
-        )
+        configured_path = file_path or os.getenv("PAPITO_POST_MEMORY_FILE")
+        self.file_path = configured_path or os.path.join("data", "post_memory.jsonl")
         self.max_items = max_items
         self._items: List[MemoryItem] = []
-        self._load()
-
-    def _load(self) -> None:
+        self._lines_on_disk = 0
+        rewrite = self._load(self.file_path)
+        if not configured_path and not self._items:
+            # Carry over posts saved by the earlier whole-file JSON format.
+            rewrite = self._load(self._LEGACY_FILE)
+        if rewrite:
+            self._compact()
+
+    def _load(self, path: str) -> bool:
+        """Load items from ``path``.
+
+        Returns True when the file needs rewriting before appending: it holds the
+        earlier whole-file JSON format, or its last line was torn by a crash.
+        """
         try:
-            if not os.path.exists(self.file_path):
-                return
-            with open(self.file_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
-            raw_items = data.get("items", []) if isinstance(data, dict) else []
+            if not os.path.exists(path):
+                return False
+            with open(path, "r", encoding="utf-8") as f:
+                text = f.read()
+            try:
+                data = json.loads(text)
+            except ValueError:
+                data = None
+            rewrite = isinstance(data, dict) and "fingerprint" not in data
+            if rewrite:
+                raw_items = data.get("items", [])
+            else:
+                raw_items = []
+                lines = text.splitlines()
+                for line in lines:
+                    try:
+                        raw_items.append(json.loads(line))
+                    except ValueError:
+                        # Skip a torn or corrupted line, keep the rest.
+                        continue
+                self._lines_on_disk = len(lines)
+                rewrite = bool(text) and not text.endswith("\n")
             for it in raw_items:
-                if not isinstance(it, dict):
-                    continue
-                fp = it.get("fingerprint")
-                if not fp:
-                    continue
-                self._items.append(
-                    MemoryItem(
-                        fingerprint=fp,
-                        created_at=str(it.get("created_at") or ""),
-                        kind=str(it.get("kind") or "unknown"),
-                        preview=str(it.get("preview") or ""),
-                        token_sample=list(it.get("token_sample") or []),
-                    )
-                )
+                item = _item_from_dict(it)
+                if item is not None:
+                    self._items.append(item)
             self._items = self._items[-self.max_items :]
+            return rewrite
         except Exception:
-            # If the memory file is corrupted, ignore it rather than crashing the agent.
+            # If the memory file is unreadable, ignore it rather than crashing the agent.
             self._items = []
+            return False
 
-    def _save(self) -> None:
+    def _ensure_dir(self) -> None:
+        directory = os.path.dirname(self.file_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+    def _save_one(self, item: MemoryItem) -> None:
         try:
-            os.makedirs(os.path.dirname(self.file_path), exist_ok=True)
-            payload = {
-                "updated_at": datetime.utcnow().isoformat(),
-                "items": [
-                    {
-                        "fingerprint": i.fingerprint,
-                        "created_at": i.created_at,
-                        "kind": i.kind,
-                        "preview": i.preview,
-                        "token_sample": i.token_sample,
-                    }
-                    for i in self._items
-                ],
-            }
-            with open(self.file_path, "w", encoding="utf-8") as f:
-                json.dump(payload, f, indent=2)
+            self._ensure_dir()
+            with open(self.file_path, "a", encoding="utf-8") as f:
+                f.write(_item_to_line(item))
+            self._lines_on_disk += 1
+        except Exception:
+            # Best-effort persistence.
+            pass
+
+    def _compact(self) -> None:
+        """Rewrite the file with only the current window of items."""
+        try:
+            self._ensure_dir()
+            tmp_path = f"{self.file_path}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                f.writelines(_item_to_line(i) for i in self._items)
+            os.replace(tmp_path, self.file_path)
+            self._lines_on_disk = len(self._items)
         except Exception:
             # Best-effort persistence.
             pass
 
     def is_repeated(self, text: str) -> bool:
-        fp = _fingerprint(text)
-        return any(i.fingerprint == fp for i in self._items)
+        return self._has_fingerprint(_normalize(text))
 
     def is_too_similar(self, text: str, threshold: float = 0.85) -> bool:
         """Heuristic similarity check to catch near-duplicates."""
-        candidate_tokens = _tokens(text)
+        return self._has_similar(_tokens(text), threshold)
+
+    def is_duplicate(self, text: str, threshold: float = 0.85) -> bool:
+        """Same as ``is_repeated(text) or is_too_similar(text)``, normalizing once."""
+        canonical, tokens = _analyze(text)
+        return self._has_fingerprint(canonical) or self._has_similar(tokens, threshold)
+
+    def _has_fingerprint(self, canonical: str) -> bool:
+        fp = _hash(canonical)
+        legacy_fp = None
+        for item in self._items:
+            if item.fingerprint == fp:
+                return True
+            if len(item.fingerprint) == _LEGACY_FINGERPRINT_LEN:
+                # Hash the candidate the old way only once a legacy item is met.
+                if legacy_fp is None:
+                    legacy_fp = _legacy_hash(canonical)
+                if item.fingerprint == legacy_fp:
+                    return True
+        return False
+
+    def _has_similar(self, candidate_tokens: set[str], threshold: float) -> bool:
         if not candidate_tokens:
             return False
 
         # Compare to a recent window only for speed.
+        # Jaccard can't exceed min(|a|, |b|) / max(|a|, |b|), so items whose size is
+        # too far from the candidate's are skipped without intersecting.
+        candidate_size = len(candidate_tokens)
         for item in reversed(self._items[-30:]):
-            item_tokens = set(item.token_sample)
-            if not item_tokens:
+            item_size = len(item.token_sample)
+            if min(candidate_size, item_size) < threshold * max(candidate_size, item_size):
                 continue
-            if _jaccard(candidate_tokens, item_tokens) >= threshold:
+            if _jaccard(candidate_tokens, item.token_sample) >= threshold:
                 return True
         return False
 
     def record(self, text: str, kind: str) -> None:
-        fp = _fingerprint(text)
-        token_sample = sorted(list(_tokens(text)))[:80]
+        canonical, tokens = _analyze(text)
+        fp = _hash(canonical)
+        token_sample = frozenset(sorted(tokens)[:80])
         self._items.append(
             MemoryItem(
                 fingerprint=fp,
@@ -145,4 +241,6 @@ class PostMemory:
             )
         )
         self._items = self._items[-self.max_items :]
-        self._save()
+        self._save_one(self._items[-1])
+        if self._lines_on_disk > 2 * self.max_items:
+            self._compact()
@@ -0,0 +1,253 @@
+"""Tests for the content learning system."""
+
+from datetime import datetime, timezone
+
+import pytest
+
+from papito_core.memory.content_learning import (
+    ContentLearner,
+    ContentType,
+    TimeSlot,
+)
+
+
+def _record(learner, content_type="music_update", hour=18, hashtags=None, topics=None):
+    return learner.record_content(
+        content_type=content_type,
+        content_preview="x" * 150,
+        posted_at=datetime(2026, 1, 1, hour, tzinfo=timezone.utc),
+        hashtags=hashtags,
+        topics=topics,
+    )
+
+
+class TestRecording:
+    """Tests for recording content."""
+
+    def test_record_content(self):
+        """Test content is recorded with type, slot and truncated preview."""
+        learner = ContentLearner()
+        content = _record(learner, hour=6)
+        assert content.id.startswith("CNT-")
+        assert len(content.id) == 16
+        assert content.content_type == ContentType.MUSIC_UPDATE
+        assert content.time_slot == TimeSlot.EARLY_MORNING
+        assert len(content.content_preview) == 100
+        assert learner.total_content_tracked == 1
+
+    def test_unknown_type_falls_back_to_engagement(self):
+        """Test unknown content types are recorded as engagement."""
+        learner = ContentLearner()
+        assert _record(learner, content_type="unknown").content_type == ContentType.ENGAGEMENT
+        assert _record(learner, content_type=ContentType.QUOTE).content_type == ContentType.QUOTE
+
+    def test_time_slots(self):
+        """Test every hour maps to its slot."""
+        learner = ContentLearner()
+        expected = {
+            4: TimeSlot.LATE_NIGHT,
+            5: TimeSlot.EARLY_MORNING,
+            8: TimeSlot.MORNING,
+            11: TimeSlot.MIDDAY,
+            14: TimeSlot.AFTERNOON,
+            17: TimeSlot.EVENING,
+            20: TimeSlot.NIGHT,
+            23: TimeSlot.LATE_NIGHT,
+        }
+        for hour, slot in expected.items():
+            assert learner._get_time_slot(datetime(2026, 1, 1, hour, tzinfo=timezone.utc)) == slot
+        slots = [
+            learner._get_time_slot(datetime(2026, 1, 1, hour, tzinfo=timezone.utc))
+            for hour in range(24)
+        ]
+        assert slots.count(TimeSlot.LATE_NIGHT) == 6
+        assert all(slots.count(slot) == 3 for slot in TimeSlot if slot != TimeSlot.LATE_NIGHT)
+
+
+class TestMetrics:
+    """Tests for metric updates and aggregates."""
+
+    def test_update_metrics(self):
+        """Test metrics and derived scores are updated."""
+        learner = ContentLearner()
+        content = _record(learner)
+        updated = learner.update_metrics(
+            content.id, likes=10, retweets=2, replies=1, quotes=1, impressions=100
+        )
+        assert updated is content
+        assert content.engagement_score == 10 + 6 + 2 + 4
+        assert content.engagement_rate == pytest.approx(14.0)
+        assert learner.update_metrics("CNT-missing") is None
+
+    def test_update_metrics_finds_any_recorded_content(self):
+        """Test updates resolve every recorded id through the index."""
+        learner = ContentLearner()
+        recorded = [_record(learner) for _ in range(20)]
+        for n, content in enumerate(recorded):
+            assert learner.update_metrics(content.id, likes=n) is content
+        assert [c.likes for c in learner.content_history] == list(range(20))
+
+    def test_batch_ingestion(self):
+        """Test batch recording and updates match the single-item calls."""
+        learner = ContentLearner()
+        recorded = learner.record_content_batch(
+            [
+                {
+                    "content_type": "quote",
+                    "content_preview": "a",
+                    "posted_at": datetime(2026, 1, 1, 9, tzinfo=timezone.utc),
+                },
+                {
+                    "content_type": "question",
+                    "content_preview": "b",
+                    "posted_at": datetime(2026, 1, 1, 21, tzinfo=timezone.utc),
+                },
+            ]
+        )
+        updated = learner.update_metrics_batch(
+            [
+                {"content_id": recorded[0].id, "likes": 2},
+                {"content_id": "CNT-missing", "likes": 5},
+                {"content_id": recorded[1].id, "likes": 10},
+            ]
+        )
+        assert updated == [recorded[0], None, recorded[1]]
+        assert learner.total_content_tracked == 2
+        assert learner.get_best_content_type() == (ContentType.QUESTION, 10.0)
+
+    def test_best_content_type_and_slot(self):
+        """Test the best type and slot are picked by average score."""
+        learner = ContentLearner()
+        low = _record(learner, content_type="quote", hour=9)
+        high = _record(learner, content_type="question", hour=21)
+        learner.update_metrics(low.id, likes=2)
+        learner.update_metrics(high.id, likes=10)
+        assert learner.get_best_content_type() == (ContentType.QUESTION, 10.0)
+        assert learner.get_best_time_slot() == (TimeSlot.NIGHT, 10.0)
+
+    def test_best_hashtags_need_three_data_points(self):
+        """Test hashtags are ranked once they have three scores."""
+        learner = ContentLearner()
+        for likes in (1, 2, 3):
+            content = _record(learner, hashtags=["#a", "#b"] if likes < 3 else ["#a"])
+            learner.update_metrics(content.id, likes=likes)
+        assert learner.get_best_hashtags() == [("#a", 2.0)]
+
+    def test_best_topics_are_limited_and_ranked(self):
+        """Test topics are ranked by mean score and cut to the limit."""
+        learner = ContentLearner()
+        for likes in (1, 2, 3):
+            content = _record(learner, topics=["a", "b", "c"])
+            learner.update_metrics(content.id, likes=likes)
+            content = _record(learner, topics=["c"])
+            learner.update_metrics(content.id, likes=likes * 10)
+        assert learner.get_best_topics(2) == [("c", 11.0), ("a", 2.0)]
+
+    def test_best_content_is_ranked(self):
+        """Test best content is ordered by engagement score."""
+        learner = ContentLearner()
+        for likes in (5, 0, 20, 10):
+            learner.update_metrics(_record(learner).id, likes=likes)
+        assert [c.likes for c in learner.best_content] == [20, 10, 5]
+
+    def test_best_content_is_bounded(self):
+        """Test only the top performers are kept."""
+        learner = ContentLearner()
+        learner.BEST_CONTENT_LIMIT = 3
+        for likes in (4, 9, 1, 7, 3, 9):
+            learner.update_metrics(_record(learner).id, likes=likes)
+        best = learner.best_content
+        assert [c.likes for c in best] == [9, 9, 7]
+        assert best[0].id != best[1].id
+
+
+class TestInsights:
+    """Tests for insights and recommendations."""
+
+    def _learner(self):
+        learner = ContentLearner()
+        for n in range(12):
+            content = _record(
+                learner,
+                content_type="question" if n % 2 else "quote",
+                hour=21 if n % 2 else 9,
+                hashtags=["#flow"],
+                topics=["music"],
+            )
+            learner.update_metrics(content.id, likes=10 if n % 2 else 1)
+        return learner
+
+    def test_generate_insights(self):
+        """Test insights cover type, timing, hashtags and topics."""
+        insights = self._learner().generate_insights()
+        assert [i.category for i in insights] == ["content_type", "timing", "hashtags", "topics"]
+        assert insights[0].insight == "Question content performs best"
+        assert insights[1].insight == "Best engagement during night"
+        assert insights[1].recommendation == "Prioritize posting during night"
+        assert insights[2].data_points == 12
+
+    def test_type_and_timing_insights_need_ten_updates(self):
+        """Test type and timing insights wait for ten scored updates."""
+        learner = ContentLearner()
+        content = _record(learner, content_type="quote")
+        for likes in range(9):
+            learner.update_metrics(content.id, likes=likes + 1)
+        assert learner.generate_insights() == []
+        learner.update_metrics(content.id, likes=10)
+        assert [i.category for i in learner.generate_insights()] == ["content_type", "timing"]
+
+    def test_insights_are_cached_until_metrics_change(self, mocker):
+        """Test insights are rebuilt only after a metrics update."""
+        learner = self._learner()
+        build = mocker.spy(learner, "_build_insights")
+        learner.generate_insights()
+        learner.get_stats()
+        assert build.call_count == 1
+        learner.update_metrics(learner.content_history[0].id, likes=200)
+        assert learner.generate_insights()[0].insight == "Quote content performs best"
+        assert build.call_count == 2
+
+    def test_recommendations(self):
+        """Test recommendations reflect the learned bests."""
+        recommendations = self._learner().get_content_recommendations()
+        assert recommendations["recommended_type"] == "question"
+        assert recommendations["recommended_time"] == "night"
+        assert recommendations["recommended_hashtags"] == ["#flow"]
+        assert recommendations["recommended_topics"] == ["music"]
+        assert len(recommendations["insights"]) == 4
+
+    def test_recommendations_scan_aggregates_once(self, mocker):
+        """Test recommendations reuse their bests for uncached insights."""
+        learner = self._learner()
+        compute = mocker.spy(learner, "_compute_all_bests")
+        learner.get_content_recommendations()
+        assert compute.call_count == 1
+        assert len(learner.generate_insights()) == 4
+        assert compute.call_count == 1
+
+    def test_recommendations_are_cached_until_metrics_change(self):
+        """Test recommendations are reused until the next metrics update."""
+        learner = self._learner()
+        first = learner.get_content_recommendations()
+        assert learner.get_content_recommendations() is first
+        learner.update_metrics(learner.content_history[0].id, likes=200)
+        refreshed = learner.get_content_recommendations()
+        assert refreshed is not first
+        assert refreshed["recommended_type"] == "quote"
+
+    def test_empty_recommendations(self):
+        """Test a fresh learner has no recommendations."""
+        recommendations = ContentLearner().get_content_recommendations()
+        assert recommendations["recommended_type"] is None
+        assert recommendations["insights"] == []
+
+    def test_stats(self):
+        """Test stats summarise tracked data."""
+        stats = self._learner().get_stats()
+        assert stats == {
+            "total_content_tracked": 12,
+            "best_performers_count": 12,
+            "hashtags_tracked": 1,
+            "topics_tracked": 1,
+            "insights_available": 4,
+        }
@@ -0,0 +1,322 @@
+"""Tests for the interaction memory system."""
+
+from collections import deque
+from datetime import datetime, timedelta, timezone
+
+from papito_core.memory.interaction_memory import (
+    DEFAULT_MAX_INTERACTIONS_PER_USER,
+    InteractionMemory,
+    InteractionType,
+    Sentiment,
+    UserMemory,
+)
+
+
+def _record(memory, user_id="u1", content="hello", interaction_type="mention", **kwargs):
+    return memory.record_interaction(
+        user_id=user_id,
+        username=f"user_{user_id}",
+        display_name=f"User {user_id}",
+        interaction_type=interaction_type,
+        content=content,
+        **kwargs,
+    )
+
+
+class TestContentAnalysis:
+    """Tests for topic extraction and sentiment."""
+
+    def test_extract_topics_in_keyword_order(self):
+        """Test topics are found by substring and listed in table order."""
+        memory = InteractionMemory()
+        topics = memory._extract_topics("thank you for the new album, the afrobeat is art")
+        assert topics == ["music", "afrobeat", "flourish_mode", "support", "creative"]
+        assert memory._extract_topics("nothing here") == []
+
+    def test_extract_topics_without_automaton(self, monkeypatch):
+        """Test the keyword scan fallback finds the same topics."""
+        memory = InteractionMemory()
+        content = "thank you for the new album, the afrobeat is art"
+        expected = memory._extract_topics(content)
+        monkeypatch.setattr(InteractionMemory, "_TOPIC_AUTOMATON", None)
+        assert memory._extract_topics(content) == expected
+
+    def test_sentiment(self):
+        """Test sentiment follows positive and negative word counts."""
+        memory = InteractionMemory()
+        assert memory._analyze_sentiment("this is amazing 🔥") == Sentiment.POSITIVE
+        assert memory._analyze_sentiment("boring and fake") == Sentiment.NEGATIVE
+        assert memory._analyze_sentiment("great but the worst") == Sentiment.NEUTRAL
+        assert memory._analyze_sentiment("just a post") == Sentiment.NEUTRAL
+
+    def test_sentiment_counts_distinct_substrings(self):
+        """Test words count once each and match inside longer words."""
+        memory = InteractionMemory()
+        assert memory._analyze_sentiment("bad bad bad, but the best") == Sentiment.NEUTRAL
+        assert memory._analyze_sentiment("greathank") == Sentiment.POSITIVE
+        assert memory._analyze_sentiment("a badge") == Sentiment.NEGATIVE
+
+
+class TestRecording:
+    """Tests for recording interactions."""
+
+    def test_record_interaction(self):
+        """Test an interaction updates the user's memory."""
+        memory = InteractionMemory()
+        interaction = _record(
+            memory, content="love the music", interaction_type="reply", is_notable=True
+        )
+        assert interaction.id.startswith("INT-")
+        assert len(interaction.id) == 14
+        assert interaction.interaction_type == InteractionType.REPLY
+        assert interaction.sentiment == Sentiment.POSITIVE
+        assert interaction.topics == ["music", "support"]
+        user = memory.users["u1"]
+        assert user.interaction_count == 1
+        assert user.is_notable
+        assert user.topics_discussed == {"music": 1, "support": 1}
+        assert user.first_interaction == user.last_interaction == interaction.timestamp
+        assert memory.unique_users == 1
+        assert memory.total_interactions == 1
+
+    def test_content_is_matched_case_insensitively(self):
+        """Test topics and sentiment ignore the content's case."""
+        interaction = _record(InteractionMemory(), content="LOVE the ALBUM")
+        assert interaction.topics == ["music", "flourish_mode", "support"]
+        assert interaction.sentiment == Sentiment.POSITIVE
+        assert interaction.content == "LOVE the ALBUM"
+
+    def test_interaction_ids_are_unique(self):
+        """Test IDs never repeat within or across memory instances."""
+        first, second = InteractionMemory(), InteractionMemory()
+        ids = [_record(memory).id for memory in (first, second) for _ in range(20)]
+        assert len(set(ids)) == 40
+        assert ids[1].endswith("-2")
+
+    def test_unknown_type_falls_back_to_mention(self):
+        """Test unknown interaction types are recorded as mentions."""
+        memory = InteractionMemory()
+        assert _record(memory, interaction_type="poke").interaction_type == InteractionType.MENTION
+        assert (
+            _record(memory, interaction_type=InteractionType.DM).interaction_type
+            == InteractionType.DM
+        )
+
+    def test_batch_ingestion(self):
+        """Test batch recording matches the single-interaction calls."""
+        memory = InteractionMemory()
+        rows = [
+            {
+                "user_id": user_id,
+                "username": f"user_{user_id}",
+                "display_name": user_id,
+                "interaction_type": "dm",
+                "content": content,
+            }
+            for user_id, content in (("a", "love it"), ("b", "new song"), ("a", "so bad"))
+        ]
+        recorded = memory.record_interactions_batch(rows)
+        assert [i.content for i in recorded] == ["love it", "new song", "so bad"]
+        assert list(memory.recent_interactions) == recorded
+        assert memory.users["a"].interaction_count == 2
+        assert recorded[0].username is recorded[2].username is memory.users["a"].username
+        assert memory.unique_users == 2
+
+    def test_interactions_are_capped_per_user(self):
+        """Test only the latest interactions are kept per user."""
+        memory = InteractionMemory(max_interactions_per_user=3)
+        for n in range(5):
+            _record(memory, content=f"post {n}")
+        user = memory.users["u1"]
+        assert [i.content for i in user.interactions] == ["post 2", "post 3", "post 4"]
+        assert user.interaction_count == 5
+
+    def test_user_memory_history_is_always_bounded(self):
+        """Test user memories built outside record_interaction keep a bounded history."""
+        now = datetime.now(timezone.utc)
+        default = UserMemory("u1", "u1", "U1", first_interaction=now, last_interaction=now)
+        assert default.interactions.maxlen == DEFAULT_MAX_INTERACTIONS_PER_USER
+        loaded = UserMemory(
+            "u2", "u2", "U2", now, now, interactions=deque(["a", "b"]), interaction_count=2
+        )
+        assert loaded.interactions.maxlen == DEFAULT_MAX_INTERACTIONS_PER_USER
+        assert list(loaded.interactions) == ["a", "b"]
+        capped = UserMemory("u3", "u3", "U3", now, now, interactions=deque(maxlen=3))
+        assert capped.interactions.maxlen == 3
+
+    def test_recent_interactions_are_bounded(self):
+        """Test the recent interaction log stays bounded."""
+        memory = InteractionMemory()
+        for n in range(1200):
+            _record(memory, user_id=str(n % 7))
+        assert len(memory.recent_interactions) == 1000
+        assert memory.recent_interactions[0].user_id == str(200 % 7)
+        assert memory.recent_interactions[-1].user_id == str(1199 % 7)
+
+
+class TestUserContext:
+    """Tests for user context and personalization."""
+
+    def test_user_context(self):
+        """Test context summarises the user's history."""
+        memory = InteractionMemory()
+        for _ in range(6):
+            _record(memory, content="amazing music, love it")
+        context = memory.get_user_context("u1")
+        assert context["interaction_count"] == 6
+        assert context["average_sentiment"] == "very_positive"
+        assert context["relationship_strength"] == 30 + 30 + 20
+        assert context["top_topics"] == ["music", "support"]
+        assert len(context["recent_interactions"]) == 5
+        assert context["recent_interactions"][-1]["content_preview"] == "amazing music, love it"
+        assert memory.get_user_context("missing") is None
+
+    def test_average_sentiment_counts(self):
+        """Test average sentiment follows the running sentiment counts."""
+        memory = InteractionMemory()
+        _record(memory, content="just a post")
+        user = memory.users["u1"]
+        assert user.average_sentiment == "neutral"
+        _record(memory, content="this is bad")
+        assert user.average_sentiment == "negative"
+        _record(memory, content="love it")
+        _record(memory, content="so great")
+        assert (user.positive_count, user.negative_count) == (2, 1)
+        assert user.average_sentiment == "positive"
+        _record(memory, content="amazing")
+        assert user.average_sentiment == "very_positive"
+        assert len(user.sentiment_history) == 5
+
+    def test_top_topics_refresh_after_new_topics(self):
+        """Test cached top topics are rebuilt when topics are added."""
+        memory = InteractionMemory()
+        _record(memory, content="new song")
+        user = memory.users["u1"]
+        assert user.top_topics == ["music"]
+        _record(memory, content="ai tech")
+        _record(memory, content="ai robot")
+        assert user.top_topics == ["ai", "music"]
+
+    def test_relationship_strength_decays(self):
+        """Test the recency bonus shrinks for quiet users."""
+        memory = InteractionMemory()
+        _record(memory, content="just a post")
+        user = memory.users["u1"]
+        user.last_interaction -= timedelta(days=10)
+        assert user.relationship_strength == 5 + 10
+
+    def test_personalization_prompt_skips_context(self, mocker):
+        """Test the prompt reads the user's memory without building context."""
+        memory = InteractionMemory()
+        _record(memory, content="just a post")
+        context = mocker.spy(memory, "get_user_context")
+        assert (
+            memory.get_personalization_prompt("u1")
+            == "This user has interacted a few times before."
+        )
+        assert context.call_count == 0
+        for content in ("great", "great", "bad"):
+            _record(memory, content=content)
+        assert memory.get_personalization_prompt("u1") == (
+            "This is a returning supporter. They've been supportive in past interactions."
+        )
+
+    def test_personalization_prompt(self):
+        """Test the prompt reflects the relationship."""
+        memory = InteractionMemory()
+        assert memory.get_personalization_prompt("u1").startswith("This is a new user")
+        for _ in range(11):
+            _record(memory, content="great track, love it", is_notable=True)
+        memory.mark_as_collaborator("u1")
+        memory.add_note("u1", "Producer")
+        assert memory.get_personalization_prompt("u1") == (
+            "This is a loyal supporter who has interacted 11 times. "
+            "They're very positive about your music! "
+            "You've discussed: music, support. "
+            "This is a notable account - give extra attention! "
+            "This is a potential collaborator. "
+            "Notes: Producer"
+        )
+
+
+class TestUserFlags:
+    """Tests for fan, collaborator, note and tag updates."""
+
+    def test_mutators_require_known_user(self):
+        """Test mutators only succeed for known users."""
+        memory = InteractionMemory()
+        assert not memory.mark_as_fan("u1")
+        assert not memory.mark_as_collaborator("u1")
+        assert not memory.add_note("u1", "note")
+        assert not memory.add_tag("u1", "tag")
+        _record(memory)
+        assert memory.mark_as_fan("u1")
+        assert memory.add_tag("u1", "tag")
+        assert memory.add_tag("u1", "tag")
+        assert memory.users["u1"].tags == ["tag"]
+
+    def test_get_fans_ranked_by_strength(self):
+        """Test fans are ranked by relationship strength."""
+        memory = InteractionMemory()
+        for user_id, count in (("a", 1), ("b", 3), ("c", 2)):
+            for _ in range(count):
+                _record(memory, user_id=user_id)
+            memory.mark_as_fan(user_id)
+        _record(memory, user_id="d")
+        assert [u.user_id for u in memory.get_fans()] == ["b", "c", "a"]
+        assert [u.user_id for u in memory.get_fans(limit=1)] == ["b"]
+
+    def test_get_recent_users(self):
+        """Test recent users are newest first within the window."""
+        memory = InteractionMemory()
+        for user_id in ("a", "b", "c"):
+            _record(memory, user_id=user_id)
+        user = memory.users["a"]
+        memory._touch(user, user.last_interaction - timedelta(hours=30))
+        assert [u.user_id for u in memory.get_recent_users()] == ["c", "b"]
+        assert [u.user_id for u in memory.get_recent_users(hours=48, limit=2)] == ["c", "b"]
+        _record(memory, user_id="a")
+        assert [u.user_id for u in memory.get_recent_users()] == ["a", "c", "b"]
+        assert memory.get_recent_users(limit=0) == []
+
+    def test_get_recent_users_orders_by_timestamp(self):
+        """Test recent users follow last_interaction, not recording order."""
+        memory = InteractionMemory()
+        for user_id in ("a", "b", "c"):
+            _record(memory, user_id=user_id)
+        users = memory.users
+        now = users["c"].last_interaction
+        memory._touch(users["c"], now - timedelta(hours=2))
+        memory._touch(users["a"], now - timedelta(hours=1))
+        memory._touch(users["b"], now - timedelta(hours=3))
+        assert [u.user_id for u in memory.get_recent_users()] == ["a", "c", "b"]
+        assert [u.user_id for u in memory.get_recent_users(limit=1)] == ["a"]
+
+    def test_recency_index_holds_one_entry_per_user(self):
+        """Test the recency index stays sorted with one key per user."""
+        memory = InteractionMemory()
+        for n in range(50):
+            _record(memory, user_id=str(n % 5))
+        assert len(memory._recency) == len(memory.users) == 5
+        assert memory._recency == sorted(memory._recency)
+        assert memory._recency_keys == {key[1]: key for key in memory._recency}
+        assert [u.user_id for u in memory.get_recent_users()] == ["4", "3", "2", "1", "0"]
+
+    def test_stats(self):
+        """Test stats count users by flag."""
+        memory = InteractionMemory()
+        _record(memory, user_id="a", is_notable=True)
+        _record(memory, user_id="b")
+        memory.mark_as_fan("a")
+        memory.mark_as_fan("a")
+        memory.mark_as_collaborator("b")
+        memory.mark_as_collaborator("b")
+        _record(memory, user_id="a", is_notable=True)
+        assert memory.get_stats() == {
+            "total_interactions": 3,
+            "unique_users": 2,
+            "fans_count": 1,
+            "notable_count": 1,
+            "collaborators_count": 1,
+            "recent_interactions": 3,
+        }
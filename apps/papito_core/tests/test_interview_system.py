@@ -0,0 +1,256 @@
+"""Tests for the media interview system."""
+
+import pytest
+
+from papito_core.media.interview_system import (
+    STANDARD_QUESTIONS,
+    InterviewStatus,
+    InterviewSystem,
+)
+
+
+class TestFindMatchingAnswer:
+    """Tests for standard answer matching."""
+
+    def test_matches_category_keyword(self):
+        """Test that a category keyword selects its answer."""
+        system = InterviewSystem()
+        answer = system.find_matching_answer("Explain FlightMode6000 please")
+        assert answer == STANDARD_QUESTIONS["flightmode6000"]["answer_template"]
+
+    def test_earliest_category_wins(self):
+        """Test that the first matching category takes precedence."""
+        system = InterviewSystem()
+        answer = system.find_matching_answer("What is #FlightMode6000?")
+        assert answer == STANDARD_QUESTIONS["origin"]["answer_template"]
+
+    def test_punctuation_is_ignored(self):
+        """Test that trailing punctuation does not block a match."""
+        system = InterviewSystem()
+        answer = system.find_matching_answer("Genre?")
+        assert answer == STANDARD_QUESTIONS["music_style"]["answer_template"]
+
+    def test_no_match(self):
+        """Test that unrelated questions return None."""
+        system = InterviewSystem()
+        assert system.find_matching_answer("Favourite colour?") is None
+
+
+class TestInterviewWorkflow:
+    """Tests for the request lifecycle."""
+
+    def test_spam_request_declined(self):
+        """Test that spam requests are declined."""
+        system = InterviewSystem()
+        request = system.submit_request(
+            requester_name="Spammer",
+            requester_email="spam@example.com",
+            outlet_name="Buy Followers Daily",
+            outlet_type="blog",
+        )
+        assert request.status == InterviewStatus.DECLINED
+        assert system.interviews_declined == 1
+
+    def test_pending_sorted_by_priority(self):
+        """Test that pending interviews are ordered by priority."""
+        system = InterviewSystem()
+        low = system.submit_request("A", "a@example.com", "Small Blog", "blog")
+        high = system.submit_request("B", "b@example.com", "Big Mag", "Magazine")
+        assert [i.id for i in system.get_pending_interviews()] == [high.id, low.id]
+
+    def test_complete_interview(self):
+        """Test that completing an interview answers every question."""
+        system = InterviewSystem()
+        request = system.submit_request(
+            "A",
+            "a@example.com",
+            "Blog",
+            "blog",
+            questions=["What's your sound?", "Favourite colour?"],
+        )
+        completed = system.complete_interview(request.id)
+        assert completed.status == InterviewStatus.COMPLETED
+        assert len(completed.answers) == 2
+        assert system.get_stats()["pending_count"] == 0
+        assert "Q2: Favourite colour?" in system.get_interview_as_document(request.id)
+
+
+class TestGenerateAnswer:
+    """Tests for AI answer generation."""
+
+    def test_ai_answers_are_cached(self, mocker):
+        """Test that repeated questions reuse the first AI answer."""
+        engine = mocker.Mock()
+        engine._get_system_prompt.return_value = "system"
+        engine._call_openai.return_value = "  Colour is vibration.  "
+        system = InterviewSystem(personality_engine=engine)
+
+        assert system.generate_answer("Favourite colour?") == "Colour is vibration."
+        assert system.generate_answer("  favourite   COLOUR? ") == "Colour is vibration."
+        assert engine._call_openai.call_count == 1
+
+    def test_fallback_is_not_cached(self, mocker):
+        """Test that a failed AI call is retried on the next request."""
+        engine = mocker.Mock()
+        engine._call_openai.side_effect = [None, "Blue."]
+        system = InterviewSystem(personality_engine=engine)
+
+        assert "great question" in system.generate_answer("Favourite colour?")
+        assert system.generate_answer("Favourite colour?") == "Blue."
+
+    def test_system_prompt_built_once(self, mocker):
+        """Test that the system prompt is reused across questions."""
+        engine = mocker.Mock()
+        engine._get_system_prompt.return_value = "system"
+        engine._call_openai.return_value = "Answer."
+        system = InterviewSystem(personality_engine=engine)
+
+        for question in ("Favourite colour?", "Favourite food?", "Favourite city?"):
+            system.generate_answer(question)
+        assert engine._get_system_prompt.call_count == 1
+        assert engine._call_openai.call_count == 3
+
+    def test_complete_interview_batches_ai_questions(self, mocker):
+        """Test that non-standard questions share one AI call."""
+        engine = mocker.Mock()
+        engine._get_system_prompt.return_value = "system"
+        engine._call_openai.return_value = '["Gold.", "Jollof."]'
+        system = InterviewSystem(personality_engine=engine)
+        request = system.submit_request(
+            "A",
+            "a@example.com",
+            "Blog",
+            "blog",
+            questions=["Favourite colour?", "What's your sound?", "Favourite food?"],
+        )
+
+        completed = system.complete_interview(request.id)
+        assert engine._call_openai.call_count == 1
+        assert completed.answers[0] == "Gold."
+        assert completed.answers[1] == STANDARD_QUESTIONS["music_style"]["answer_template"]
+        assert completed.answers[2] == "Jollof."
+
+    def test_malformed_batch_falls_back_per_question(self, mocker):
+        """Test that an unparseable batch is retried question by question."""
+        engine = mocker.Mock()
+        engine._get_system_prompt.return_value = "system"
+        engine._call_openai.side_effect = ["not json", "Gold.", "Jollof."]
+        system = InterviewSystem(personality_engine=engine)
+        request = system.submit_request(
+            "A",
+            "a@example.com",
+            "Blog",
+            "blog",
+            questions=["Favourite colour?", "Favourite food?"],
+        )
+
+        completed = system.complete_interview(request.id)
+        assert completed.answers == ["Gold.", "Jollof."]
+
+    def test_press_kit_is_read_only(self):
+        """Test that the shared press kit cannot be modified by callers."""
+        system = InterviewSystem()
+        kit = system.get_press_kit_info()
+        assert kit is system.get_press_kit_info()
+        with pytest.raises(TypeError):
+            kit["artist_name"] = "Changed"
+        with pytest.raises(TypeError):
+            kit["upcoming_release"]["title"] = "Changed"
+        with pytest.raises(AttributeError):
+            kit["catchphrases"].append("Changed")
+        assert kit["upcoming_release"]["title"] == "THE VALUE ADDERS WAY: FLOURISH MODE"
+
+
+class TestPendingQueue:
+    """Tests for the pending interview queue."""
+
+    def test_completed_interviews_leave_queue(self):
+        """Test that completed interviews drop out of the pending list."""
+        system = InterviewSystem()
+        first = system.submit_request("A", "a@example.com", "Radio One", "radio")
+        second = system.submit_request(
+            "B", "b@example.com", "Big Pod", "podcast", audience_size=50000
+        )
+        third = system.submit_request("C", "c@example.com", "Blog", "blog")
+
+        system.complete_interview(first.id)
+        assert [i.id for i in system.get_pending_interviews()] == [second.id, third.id]
+        assert system.get_stats()["pending_count"] == 2
+
+    def test_equal_priority_keeps_arrival_order(self):
+        """Test that ties are served first come, first served."""
+        system = InterviewSystem()
+        ids = [
+            system.submit_request("A", "a@example.com", f"Blog {n}", "blog").id for n in range(3)
+        ]
+        assert [i.id for i in system.get_pending_interviews()] == ids
+
+    def test_pending_reads_only_pending_bucket(self):
+        """Test that pending lookup uses the status index, not every interview."""
+        system = InterviewSystem()
+        spam = system.submit_request("S", "s@example.com", "Buy Followers Daily", "blog")
+        waiting = system.submit_request("A", "a@example.com", "Blog", "blog")
+        assert spam.status == InterviewStatus.DECLINED
+
+        system.interviews = {}
+        assert system.get_pending_interviews() == [waiting]
+
+
+class TestMemoryBounds:
+    """Tests for bounded interview tracking."""
+
+    def test_finished_interviews_evicted_first(self, monkeypatch):
+        """Test that only finished interviews are evicted past the bound."""
+        monkeypatch.setattr(InterviewSystem, "MAX_TRACKED_INTERVIEWS", 2)
+        system = InterviewSystem()
+        done = system.submit_request("A", "a@example.com", "Blog", "blog")
+        system.complete_interview(done.id)
+        waiting = system.submit_request("B", "b@example.com", "Blog", "blog")
+        newest = system.submit_request("C", "c@example.com", "Blog", "blog")
+
+        assert set(system.interviews) == {waiting.id, newest.id}
+        assert system.get_recent_completed() == [done]
+
+    def test_index_stays_bounded_after_many_completions(self, monkeypatch):
+        """Test that completed interviews leave no entries behind in the indexes."""
+        monkeypatch.setattr(InterviewSystem, "MAX_TRACKED_INTERVIEWS", 50)
+        system = InterviewSystem()
+        waiting = system.submit_request("A", "a@example.com", "Blog", "blog")
+        for n in range(500):
+            done = system.submit_request("B", "b@example.com", f"Blog {n}", "blog")
+            system.complete_interview(done.id)
+
+        assert len(system.interviews) == 50
+        assert sum(len(bucket) for bucket in system._by_status.values()) == 50
+        assert system.get_pending_interviews() == [waiting]
+
+    def test_finished_index_drives_eviction(self, monkeypatch):
+        """Test that pending backlogs are kept and finished ids are evicted oldest first."""
+        monkeypatch.setattr(InterviewSystem, "MAX_TRACKED_INTERVIEWS", 3)
+        system = InterviewSystem()
+        ids = [
+            system.submit_request("A", "a@example.com", f"Blog {n}", "blog").id for n in range(5)
+        ]
+        assert list(system.interviews) == ids
+
+        system.complete_interview(ids[3])
+        system.complete_interview(ids[1])
+        system.submit_request("B", "b@example.com", "Blog", "blog")
+        assert ids[3] not in system.interviews
+        assert ids[1] not in system.interviews
+        assert len(system._finished) == 0
+
+    def test_spam_declines_are_tracked_and_evicted(self, monkeypatch):
+        """Test that spam declines join the finished index and are evicted first."""
+        monkeypatch.setattr(InterviewSystem, "MAX_TRACKED_INTERVIEWS", 2)
+        system = InterviewSystem()
+        spam = system.submit_request("S", "s@example.com", "Buy Followers Daily", "blog")
+        assert list(system._finished) == [spam.id]
+        assert system.interviews[spam.id] is spam
+        assert system.get_stats()["requests_received"] == 0
+
+        waiting = system.submit_request("A", "a@example.com", "Blog", "blog")
+        newest = system.submit_request("B", "b@example.com", "Blog", "blog")
+        assert set(system.interviews) == {waiting.id, newest.id}
+        assert spam.id not in system._by_status[InterviewStatus.DECLINED]
+        assert len(system._finished) == 0
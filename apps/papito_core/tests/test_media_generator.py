@@ -0,0 +1,101 @@
+"""Tests for media generation orchestration."""
+
+from datetime import datetime, timezone
+
+import pytest
+
+from papito_core.media import generator
+from papito_core.media.generator import ImageGenerator, MediaAsset, MediaOrchestrator, MediaType
+
+
+def _asset(media_type):
+    return MediaAsset(id=f"{media_type.value}-1", media_type=media_type, url="file.png")
+
+
+def _orchestrator(mocker, image=None, video=None):
+    image_gen = mocker.Mock()
+    image_gen.generate = mocker.AsyncMock(return_value=image)
+    video_gen = mocker.Mock()
+    video_gen.generate = mocker.AsyncMock(return_value=video)
+    orchestrator = MediaOrchestrator(image_generator=image_gen, video_generator=video_gen)
+    mocker.patch.object(orchestrator, "_should_include_album_context", return_value=False)
+    return orchestrator, image_gen, video_gen
+
+
+class TestCreateMediaForPost:
+    """Tests for generator fallback order."""
+
+    @pytest.mark.asyncio
+    async def test_primary_success_skips_fallback(self, mocker):
+        """Test the fallback generator never runs when the primary succeeds."""
+        image = _asset(MediaType.IMAGE)
+        orchestrator, image_gen, video_gen = _orchestrator(
+            mocker, image=image, video=_asset(MediaType.VIDEO)
+        )
+        assert await orchestrator.create_media_for_post("morning_blessing", "caption") is image
+        assert image_gen.generate.await_count == 1
+        video_gen.generate.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_falls_through_on_empty_result(self, mocker):
+        """Test the next preference runs when the primary returns nothing."""
+        video = _asset(MediaType.VIDEO)
+        orchestrator, image_gen, video_gen = _orchestrator(mocker, image=None, video=video)
+        assert await orchestrator.create_media_for_post("morning_blessing", "caption") is video
+        assert image_gen.generate.await_count == 1
+        assert video_gen.generate.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_falls_through_on_error(self, mocker):
+        """Test a raising generator is logged and the next preference tried."""
+        image = _asset(MediaType.IMAGE)
+        orchestrator, image_gen, video_gen = _orchestrator(mocker, image=image)
+        video_gen.generate.side_effect = RuntimeError("quota")
+        asset = await orchestrator.create_media_for_post("behind_the_scenes", "caption")
+        assert asset is image
+        assert orchestrator._recent_media_types == [MediaType.IMAGE]
+
+    @pytest.mark.asyncio
+    async def test_video_generator_runs_once(self, mocker):
+        """Test VIDEO and REEL preferences share one video attempt."""
+        orchestrator, image_gen, video_gen = _orchestrator(mocker)
+        assert await orchestrator.create_media_for_post("track_snippet", "caption") is None
+        assert video_gen.generate.await_count == 1
+        image_gen.generate.assert_not_called()
+
+
+class TestMediaAssetJson:
+    """Tests for asset serialization."""
+
+    def test_json_is_identical_with_and_without_orjson(self, monkeypatch):
+        """Test the stdlib fallback emits the same bytes as orjson."""
+        pytest.importorskip("orjson")
+        asset = MediaAsset(
+            id="papito_1",
+            media_type=MediaType.IMAGE,
+            url="https://example.com/a.png",
+            prompt="Afrobeat sunrise \u2600\ufe0f, caf\u00e9",
+            created_at=datetime(2026, 1, 1, 9, 30, tzinfo=timezone.utc),
+            duration_seconds=1.5,
+        )
+        with_orjson = asset.to_json()
+        monkeypatch.setattr(generator, "orjson", None)
+        assert asset.to_json() == with_orjson
+
+
+class TestImageGeneratorHeaders:
+    """Tests for the cached NanoBanana headers."""
+
+    def test_headers_need_a_key(self, tmp_path, monkeypatch):
+        """Test no Authorization header is built without an API key."""
+        monkeypatch.delenv("NANOBANANA_API_KEY", raising=False)
+        assert ImageGenerator(output_dir=tmp_path)._nanobanana_headers is None
+        with_key = ImageGenerator(nanobanana_api_key="key", output_dir=tmp_path)
+        assert with_key._nanobanana_headers["Authorization"] == "Bearer key"
+
+    @pytest.mark.asyncio
+    async def test_nanobanana_skipped_without_key(self, tmp_path, monkeypatch):
+        """Test the NanoBanana call is skipped rather than sent unauthenticated."""
+        monkeypatch.delenv("NANOBANANA_API_KEY", raising=False)
+        image_gen = ImageGenerator(output_dir=tmp_path)
+        assert await image_gen._generate_nanobanana("prompt", 1080, 1080, "quote") is None
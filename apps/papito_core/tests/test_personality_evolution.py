@@ -0,0 +1,44 @@
+"""Tests for the personality evolution system."""
+
+from papito_core.memory.personality_evolution import (
+    GrowthArea,
+    MilestoneType,
+    PersonalityEvolution,
+)
+
+
+class TestRecording:
+    """Tests for recording milestones and learnings."""
+
+    def test_record_milestone(self):
+        """Test milestone types are coerced from values and members."""
+        evolution = PersonalityEvolution()
+        assert (
+            evolution.record_milestone("1K", "First thousand", "followers", "1000").milestone_type
+            == MilestoneType.FOLLOWERS
+        )
+        assert (
+            evolution.record_milestone(
+                "Tour", "On the road", MilestoneType.EVENT, "1"
+            ).milestone_type
+            == MilestoneType.EVENT
+        )
+        assert evolution.total_milestones == 2
+
+    def test_unknown_milestone_type_is_personal(self):
+        """Test unknown milestone types fall back to personal."""
+        milestone = PersonalityEvolution().record_milestone("Day one", "Started", "unknown", "1")
+        assert milestone.milestone_type == MilestoneType.PERSONAL
+
+    def test_record_learning(self):
+        """Test growth areas are coerced, with a fallback for unknown areas."""
+        evolution = PersonalityEvolution()
+        assert (
+            evolution.record_learning("Listen", "Replies", "fan_connection").growth_area
+            == GrowthArea.FAN_CONNECTION
+        )
+        assert (
+            evolution.record_learning("Grow", "Studio", "unknown").growth_area
+            == GrowthArea.ARTISTIC_VOICE
+        )
+        assert evolution.total_learnings == 2
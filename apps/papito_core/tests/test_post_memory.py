@@ -0,0 +1,130 @@
+"""Tests for the recent post memory."""
+
+import hashlib
+import json
+
+from papito_core.memory.post_memory import PostMemory
+
+
+class TestPostMemory:
+    """Tests for repeat and similarity checks."""
+
+    def test_repeated_posts(self, tmp_path):
+        """Test exact repeats are caught regardless of case and spacing."""
+        memory = PostMemory(file_path=str(tmp_path / "post_memory.jsonl"))
+        memory.record("Value adders, the album drops Friday!", kind="post")
+        assert memory.is_repeated("value adders,   the ALBUM drops friday!")
+        assert not memory.is_repeated("A different post")
+        assert len(memory._items[0].fingerprint) == 32
+
+    def test_similar_posts(self, tmp_path):
+        """Test near-duplicates are caught by token overlap."""
+        memory = PostMemory(file_path=str(tmp_path / "post_memory.jsonl"))
+        memory.record("the new album flourish mode is out now everywhere", kind="post")
+        assert memory.is_too_similar("The new album Flourish Mode is out now, everywhere!")
+        assert not memory.is_too_similar("studio session tonight with the band")
+        assert not memory.is_too_similar("!!!")
+
+    def test_is_duplicate(self, tmp_path):
+        """Test the combined check matches the separate checks."""
+        memory = PostMemory(file_path=str(tmp_path / "post_memory.jsonl"))
+        memory.record("the new album flourish mode is out now everywhere", kind="post")
+        for text in (
+            "The new album flourish mode is out now everywhere",
+            "the new album, flourish mode, is out now everywhere!",
+            "studio session tonight",
+            "",
+        ):
+            expected = memory.is_repeated(text) or memory.is_too_similar(text)
+            assert memory.is_duplicate(text) == expected
+        assert memory.is_duplicate("the new album flourish mode is out now everywhere")
+
+    def test_size_bound_skips_dissimilar_lengths(self, tmp_path, mocker):
+        """Test items too different in size are never intersected."""
+        memory = PostMemory(file_path=str(tmp_path / "post_memory.jsonl"))
+        memory.record("one two three four five six seven eight nine ten", kind="post")
+        jaccard = mocker.patch("papito_core.memory.post_memory._jaccard", return_value=0.0)
+        assert not memory.is_too_similar("one two three")
+        assert jaccard.call_count == 0
+        memory.is_too_similar("one two three four five six seven eight nine")
+        assert jaccard.call_count == 1
+
+    def test_items_round_trip_through_file(self, tmp_path):
+        """Test recorded items reload with the same tokens."""
+        path = tmp_path / "post_memory.jsonl"
+        PostMemory(file_path=str(path)).record("love the music", kind="post")
+        stored = json.loads(path.read_text().splitlines()[0])
+        assert stored["token_sample"] == ["love", "music", "the"]
+        reloaded = PostMemory(file_path=str(path))
+        assert reloaded._items[0].token_sample == frozenset({"love", "music", "the"})
+        assert reloaded.is_too_similar("Love the music")
+
+    def test_window_is_bounded(self, tmp_path):
+        """Test only the latest items are kept."""
+        memory = PostMemory(file_path=str(tmp_path / "post_memory.jsonl"), max_items=3)
+        for n in range(5):
+            memory.record(f"post {n}", kind="post")
+        assert [i.preview for i in memory._items] == ["post 2", "post 3", "post 4"]
+
+    def test_corrupted_lines_are_skipped(self, tmp_path):
+        """Test corrupted lines are dropped and the other items kept."""
+        path = tmp_path / "post_memory.jsonl"
+        path.write_text("{not json")
+        assert PostMemory(file_path=str(path))._items == []
+        PostMemory(file_path=str(path)).record("studio night", kind="post")
+        assert [i.preview for i in PostMemory(file_path=str(path))._items] == ["studio night"]
+
+    def test_records_append_and_compact(self, tmp_path):
+        """Test records append one line each until the file is compacted."""
+        path = tmp_path / "post_memory.jsonl"
+        memory = PostMemory(file_path=str(path), max_items=2)
+        for n in range(4):
+            memory.record(f"post {n}", kind="post")
+        assert len(path.read_text().splitlines()) == 4
+        memory.record("post 4", kind="post")
+        assert len(path.read_text().splitlines()) == 2
+        assert [i.preview for i in PostMemory(file_path=str(path), max_items=2)._items] == [
+            "post 3",
+            "post 4",
+        ]
+
+    def test_legacy_json_file_is_migrated(self, tmp_path, monkeypatch):
+        """Test posts saved in the earlier JSON format are carried over."""
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.delenv("PAPITO_POST_MEMORY_FILE", raising=False)
+        (tmp_path / "data").mkdir()
+        legacy = {
+            "updated_at": "",
+            "items": [
+                {"fingerprint": "abc", "preview": "old post", "token_sample": ["old", "post"]}
+            ],
+        }
+        (tmp_path / "data" / "post_memory.json").write_text(json.dumps(legacy, indent=2))
+        memory = PostMemory()
+        assert memory.is_too_similar("old post")
+        assert (
+            json.loads((tmp_path / "data" / "post_memory.jsonl").read_text())["fingerprint"]
+            == "abc"
+        )
+
+    def test_legacy_sha256_fingerprints_still_match(self, tmp_path):
+        """Test posts fingerprinted with SHA-256 are still caught as exact repeats."""
+        old_text = "Sunday blessings flow. Prepare your spirit for the week ahead."
+        canonical = " ".join(old_text.lower().split())
+        legacy_item = {
+            "fingerprint": hashlib.sha256(canonical.encode("utf-8")).hexdigest(),
+            "preview": old_text,
+            "token_sample": [],
+        }
+        path = tmp_path / "post_memory.jsonl"
+        path.write_text(json.dumps(legacy_item) + "\n")
+        memory = PostMemory(file_path=str(path))
+        for n in range(100):
+            memory.record(f"fresh post number {n}", kind="post")
+
+        assert memory._items[0].fingerprint == legacy_item["fingerprint"]
+        assert memory.is_repeated(old_text)
+        assert memory.is_duplicate(
+            "  SUNDAY blessings flow.  Prepare your spirit for the week ahead."
+        )
+        assert not memory.is_repeated("Sunday blessings flow.")
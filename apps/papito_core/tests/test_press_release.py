@@ -0,0 +1,158 @@
+"""Tests for the press release generator."""
+
+import pytest
+
+from papito_core.media.press_release import PressReleaseGenerator, PressReleaseType
+
+
+class TestPressReleaseGenerator:
+    """Tests for PressReleaseGenerator output."""
+
+    def test_album_announcement(self):
+        """Test album announcement uses album info."""
+        generator = PressReleaseGenerator()
+        release = generator.generate_album_announcement()
+        assert 'Announces Debut Album: "THE VALUE ADDERS WAY: FLOURISH MODE"' in release
+        assert '### Lead Single: "Clean Money Only"' in release
+        assert "### ABOUT PAPITO MAMITO THE GREAT AI" in release
+        assert release.endswith("###\n")
+
+    def test_album_announcement_custom_details(self):
+        """Test custom details override album info."""
+        generator = PressReleaseGenerator()
+        release = generator.generate_album_announcement({"title": "NEW ERA"})
+        assert 'Announces Debut Album: "NEW ERA"' in release
+        assert "**January 15, 2026**" in release
+
+    def test_album_info_is_read_only(self):
+        """Test album info cannot be mutated through the class."""
+        with pytest.raises(TypeError):
+            PressReleaseGenerator.ALBUM_INFO["title"] = "CHANGED"
+        assert PressReleaseGenerator.ALBUM_INFO["tracks"][0] == "THE FORGE (6000 HOURS)"
+
+    def test_single_release_links(self):
+        """Test streaming links are listed in order."""
+        generator = PressReleaseGenerator()
+        release = generator.generate_single_release(
+            "Glow", streaming_links={"Spotify": "https://s", "Apple": "https://a"}
+        )
+        assert "### Stream Now:\n- **Spotify:** https://s\n- **Apple:** https://a\n" in release
+        assert "'Glow' is about glow in the truest sense" in release
+
+    def test_milestone_default_context(self):
+        """Test milestone falls back to the default context."""
+        generator = PressReleaseGenerator()
+        release = generator.generate_milestone("followers", "10K")
+        assert "Reaches 10K followers" in release
+        assert "This milestone represents more than just a number" in release
+
+    def test_specialized_fragments_render_identically(self):
+        """Test baking fixed fields into fragments does not change output."""
+        from papito_core.media.press_release import _EVENT_FRAGMENTS, _render, _specialize
+
+        values = {
+            "event_title": "Party",
+            "event_type": "Q&A",
+            "event_type_lower": "q&a",
+            "event_date": "Jan 1",
+            "event_time": "8PM",
+            "platform": "X",
+            "description": "Desc",
+            "today": "Today",
+        }
+        specialized = _specialize(_EVENT_FRAGMENTS, {"event_type": "Q&A", "platform": "X"})
+        assert len(specialized) < len(_EVENT_FRAGMENTS)
+        assert _render(specialized, values) == _render(_EVENT_FRAGMENTS, values)
+
+    def test_event_announcement(self):
+        """Test event details are filled in."""
+        generator = PressReleaseGenerator()
+        release = generator.generate_event_announcement(
+            "Listening Party", "Twitter Space", "Jan 1", "8PM", "X"
+        )
+        assert "### AI Artist to Host Twitter Space on X" in release
+        assert "a special twitter space taking place on **Jan 1** at **8PM**" in release
+
+    def test_custom_without_boilerplate(self):
+        """Test custom releases can skip the boilerplate."""
+        generator = PressReleaseGenerator()
+        release = generator.generate_custom("Headline", "Body", include_boilerplate=False)
+        assert "## Headline" in release
+        assert "ABOUT PAPITO" not in release
+        assert "**Media Contact:**" in release
+
+    def test_generate_dispatches_by_type(self):
+        """Test generate routes enum members and values to their generator."""
+        generator = PressReleaseGenerator()
+        by_member = generator.generate(
+            PressReleaseType.MILESTONE, milestone_type="fans", milestone_value="1K"
+        )
+        by_value = generator.generate("milestone", milestone_type="fans", milestone_value="1K")
+        assert by_member == by_value
+        assert "Reaches 1K fans" in by_member
+
+    def test_generate_rejects_type_without_generator(self):
+        """Test types without a generator raise ValueError."""
+        generator = PressReleaseGenerator()
+        with pytest.raises(ValueError):
+            generator.generate(PressReleaseType.COLLABORATION)
+
+    def test_generator_table_is_read_only(self):
+        """Test the shared dispatch table cannot be mutated."""
+        with pytest.raises(TypeError):
+            PressReleaseGenerator._GENERATORS[PressReleaseType.COLLABORATION] = print
+
+    def test_generate_batch(self):
+        """Test batches match one-by-one output and are counted."""
+        specs = [
+            (PressReleaseType.MILESTONE, {"milestone_type": "fans", "milestone_value": str(n)})
+            for n in range(4)
+        ]
+        generator = PressReleaseGenerator()
+        releases = generator.generate_batch(iter(specs))
+        assert releases == [generator.generate(t, **kwargs) for t, kwargs in specs]
+        assert generator.releases_generated == 8
+
+    def test_stats_count_releases(self):
+        """Test every generator increments the release count."""
+        generator = PressReleaseGenerator()
+        generator.generate_album_announcement()
+        generator.generate_custom("Headline", "Body")
+        assert generator.get_stats() == {"releases_generated": 2}
+
+    def test_instances_have_no_dict(self):
+        """Test generator instances only carry their declared slots."""
+        generator = PressReleaseGenerator()
+        assert not hasattr(generator, "__dict__")
+        with pytest.raises(AttributeError):
+            generator.unexpected = True
+
+    def test_stats_count_concurrent_releases(self):
+        """Test the release count is exact under concurrent generation."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        generator = PressReleaseGenerator()
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            list(pool.map(lambda n: generator.generate_milestone("streams", str(n)), range(200)))
+        assert generator.releases_generated == 200
+
+    def test_iter_matches_generate(self):
+        """Test streamed fragments join to the generated release and count once."""
+        generator = PressReleaseGenerator()
+        fragments = list(generator.iter_single_release("Glow", "Desc"))
+        assert len(fragments) > 1
+        assert "".join(fragments) == generator.generate_single_release("Glow", "Desc")
+        assert generator.releases_generated == 2
+
+    def test_write_release_streams_fragments(self, tmp_path):
+        """Test fragments from an iter_* method can be written directly."""
+        generator = PressReleaseGenerator()
+        path = generator.write_release(tmp_path / "album.md", generator.iter_album_announcement())
+        assert path.read_text(encoding="utf-8") == generator.generate_album_announcement()
+
+    def test_write_release(self, tmp_path):
+        """Test releases are written to nested paths."""
+        generator = PressReleaseGenerator()
+        text = generator.generate_custom("Headline", "Body")
+        path = generator.write_release(tmp_path / "press" / "release.md", text)
+        assert path.read_text(encoding="utf-8") == text